@@ -1,26 +1,191 @@
 """Base classes for benchmark implementations."""
 
+import hashlib
 import json
+import math
+import os
+import shlex
+import shutil
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from statistics import median
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-import requests
-from rich.console import Console
 from rich.table import Table
 
+# scripts/benchmark/base.py -> scripts/ and project root, resolved once at import
+_HERE = Path(__file__).resolve()
+_SCRIPTS_DIR = _HERE.parent.parent
+_PROJECT_ROOT = _SCRIPTS_DIR.parent
+
 import sys
-sys.path.append(str(Path(__file__).parent.parent))
-from common import get_config, get_frameworks, show_header, show_success, show_error
+sys.path.append(str(_SCRIPTS_DIR))
+from common import console, get_config, show_header, show_success, show_error
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
+
+
+# frameworks.json, shared by every runner
+FRAMEWORKS_CONFIG_PATH = str(_PROJECT_ROOT / "frameworks.json")
+
+# Characters that mean a command needs a real shell to run
+_SHELL_METACHARS = frozenset("|&;<>()$`*?~{}\n")
+
+# Results of runners whose output depends only on files on disk, reused while those files are unchanged
+RESULT_CACHE_DIR = _PROJECT_ROOT / ".bench_cache" / "results"
+# Directories left out when fingerprinting a runner's input files
+_FINGERPRINT_SKIP_DIRS = frozenset({"node_modules", "__pycache__"})
+
+# Append-only run log kept in each dated results directory
+DAILY_INDEX_LOG = "index.ndjson"
+# Small summary of the most recent run per benchmark type, in the results root
+LATEST_INDEX_FILE = "latest.json"
+
+# Display value formatters for averaged metrics, keyed by the unit Lighthouse reported.
+# Numeric values are always in milliseconds for time metrics.
+_UNIT_FORMATTERS = {
+    "s": lambda value: f"{value / 1000:.1f}\u00a0s",
+    "ms": lambda value: f"{value:.0f}\u00a0ms",
+    None: lambda value: f"{value:.3f}",  # Unitless metrics (like CLS)
+}
+
+
+def _display_unit(display_value: str) -> Optional[str]:
+    """Get the unit suffix of a display value such as '1.2 s' or '120 ms'."""
+    if display_value.endswith("ms"):
+        return "ms"
+    if display_value.endswith("s"):
+        return "s"
+    return None
+
+
+@lru_cache(maxsize=4)
+def load_frameworks_config(path: str = FRAMEWORKS_CONFIG_PATH) -> Dict[str, Any]:
+    """Load frameworks.json, parsing it once per process.
+    
+    The returned dict is shared between callers, so treat it as read-only.
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _tree_fingerprint(root: Path, digest: hashlib.blake2b):
+    """Feed the relative path, size and mtime of every file under root into a digest."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Sorted so the fingerprint doesn't depend on directory listing order
+        dirnames[:] = sorted(d for d in dirnames if d not in _FINGERPRINT_SKIP_DIRS and not d.startswith("."))
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            digest.update(f"{os.path.relpath(path, root)}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+
+
+def _dump_json(path: Path, obj: Any):
+    """Write an object to disk as indented JSON, using orjson when available.
+    
+    The document is serialized in memory first and written in a single call,
+    rather than streamed to the file in small chunks.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2, default=_json_default).encode()
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _load_json(path: Path) -> Any:
+    """Read a JSON file from disk, using orjson when available."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _append_json_line(path: Path, obj: Any):
+    """Append an object to an NDJSON log as a single line."""
+    if orjson is not None:
+        line = orjson.dumps(obj) + b"\n"
+    else:
+        line = (json.dumps(obj) + "\n").encode()
+    with open(path, 'ab') as f:
+        f.write(line)
+
+
+def _read_json_lines(path: Path) -> List[Any]:
+    """Read every parseable line of an NDJSON log, skipping corrupt ones."""
+    entries = []
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                try:
+                    entries.append(loads(line))
+                except ValueError:
+                    continue
+    return entries
+
 
-console = Console()
+def compact_index(base_dir: Path) -> Path:
+    """Rebuild the daily and global index.json files from the NDJSON run logs."""
+    available_dates = []
+    available_types = set()
+    latest_results = {}
+    last_updated = None
+    
+    for date_dir in sorted(d for d in base_dir.iterdir() if (d / DAILY_INDEX_LOG).is_file()):
+        # Keep only the most recent entry per benchmark type (later lines win)
+        benchmarks = {}
+        for entry in _read_json_lines(date_dir / DAILY_INDEX_LOG):
+            benchmarks[entry["benchmark_type"]] = entry
+        if not benchmarks:
+            continue
+        
+        daily_last_updated = max(b["timestamp"] for b in benchmarks.values())
+        _dump_json(date_dir / "index.json", {
+            "benchmarks": list(benchmarks.values()),
+            "last_updated": daily_last_updated,
+            "date": date_dir.name
+        })
+        
+        available_dates.append(date_dir.name)
+        available_types.update(benchmarks)
+        last_updated = daily_last_updated  # Dates are visited oldest first
+        for slug, entry in benchmarks.items():
+            latest_results[slug] = {
+                "date": date_dir.name,
+                "timestamp": entry["timestamp"],
+                "file": f"{date_dir.name}/{entry['file']}",
+                "frameworks_count": entry["frameworks_count"],
+                "successful_count": entry["successful_count"]
+            }
+    
+    global_index_path = base_dir / "index.json"
+    _dump_json(global_index_path, {
+        "available_dates": sorted(available_dates, reverse=True),  # Most recent first
+        "available_benchmark_types": sorted(available_types),
+        "latest_results": latest_results,
+        "last_updated": last_updated
+    })
+    return global_index_path
 
 
 class BenchmarkResult:
     """Container for benchmark results."""
     
+    __slots__ = ('framework', 'benchmark_type', 'data', 'timestamp', 'success', 'error_message')
+    
     def __init__(self, framework: str, benchmark_type: str, data: Dict[str, Any], 
                  timestamp: Optional[datetime] = None):
         self.framework = framework
@@ -47,16 +212,56 @@ class BenchmarkResult:
         }
 
 
+def _json_default(obj: Any) -> Any:
+    """Serialize objects the JSON encoders don't handle natively."""
+    if isinstance(obj, BenchmarkResult):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class BenchmarkRunner(ABC):
     """Abstract base class for benchmark runners."""
     
+    # Set on runners that share a browser or measure wall-clock timings,
+    # where running frameworks side by side would skew the results
+    requires_serial = False
+    
+    # Whether repeated executions can differ and are worth averaging; static analyses always match
+    averages_executions = True
+    
+    # Resolved apps/ directory, shared by all runners once found
+    _apps_dir: Optional[Path] = None
+    
+    # Serve results from RESULT_CACHE_DIR for runners that name their input files,
+    # while neither those files nor the benchmark code have changed
+    use_result_cache = True
+    # Anything else a cached result depends on, such as which compressor produced it
+    _result_cache_salt = ""
+    
+    # Progress callbacks for the current run_all_frameworks call, around each execution
+    _on_start: Optional[Callable[[str], None]] = None
+    _on_result: Optional[Callable[[BenchmarkResult], None]] = None
+    
     def __init__(self):
+        self.project_root = _PROJECT_ROOT
         self.config = get_config()
-        self.frameworks = get_frameworks()
+        # Framework ids are repeated across every result and metadata list, so share one copy
+        self.frameworks = [{**fw, "id": sys.intern(fw["id"])} for fw in load_frameworks_config().get("frameworks", [])]
+        self._frameworks_by_id = {fw["id"]: fw for fw in self.frameworks}
         self.benchmark_config = self.config.get("benchmarks", {})
         self.server_config = self.benchmark_config.get("server", {})
         self.output_config = self.benchmark_config.get("output", {})
         self.results: List[BenchmarkResult] = []
+        self.parallelism = max(1, int(self.benchmark_config.get("parallelism", 1)))
+        self.fail_fast_after = max(0, int(self.benchmark_config.get("failFastAfter", 2)))
+        
+        self._http_session = None
+        
+        # Cache derived names, as benchmark_name is a property on every subclass
+        self._benchmark_name = self.benchmark_name
+        self._benchmark_name_lower = self._benchmark_name.lower()
+        self._benchmark_slug = self._benchmark_name_lower.replace(' ', '_')
+        self._benchmark_type_config = self.benchmark_config.get(self._benchmark_name_lower, {})
     
     @property
     @abstractmethod
@@ -69,6 +274,46 @@ class BenchmarkRunner(ABC):
         """Run benchmark for a single framework."""
         pass
     
+    def _get_apps_dir(self) -> Optional[Path]:
+        """Find the apps directory, probing the candidate locations only once per process."""
+        if BenchmarkRunner._apps_dir is None:
+            for possible_path in [
+                self.project_root / "apps",    # From project root
+                Path("../../apps"),            # Relative from scripts/benchmark/
+                Path("apps"),                  # From current working directory
+            ]:
+                if possible_path.exists():
+                    BenchmarkRunner._apps_dir = possible_path.resolve()  # Get absolute path
+                    break
+        return BenchmarkRunner._apps_dir
+    
+    def _prepare_command(self, command: str) -> Tuple[Union[str, List[str]], bool]:
+        """Split a command into argv so it can run without spawning a shell."""
+        if _SHELL_METACHARS.intersection(command):
+            return command, True
+        
+        args = shlex.split(command)
+        # Resolve the executable up front so npx.cmd etc. are found on Windows
+        executable = shutil.which(args[0])
+        if executable:
+            args[0] = executable
+        return args, False
+    
+    @property
+    def _http(self):
+        """Shared HTTP session, so repeated requests reuse pooled connections.
+        
+        Created on first use, so runners that never make HTTP calls don't pay
+        for importing requests.
+        """
+        if self._http_session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            self._http_session = requests.Session()
+            self._http_session.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+        return self._http_session
+    
     def get_framework_url(self, framework: str) -> str:
         """Get the URL for a framework app."""
         base_url = self.server_config.get("baseUrl", "http://127.0.0.1:3000")
@@ -76,22 +321,32 @@ class BenchmarkRunner(ABC):
     
     def check_server_health(self) -> bool:
         """Check if the benchmark server is running."""
+        import requests
+        
         try:
             base_url = self.server_config.get("baseUrl", "http://127.0.0.1:3000")
             health_endpoint = self.server_config.get("healthEndpoint", "/health")
-            response = requests.get(f"{base_url}{health_endpoint}", timeout=5)
+            response = self._http.get(f"{base_url}{health_endpoint}", timeout=5)
             return response.status_code == 200
         except requests.RequestException:
             return False
     
-    def run_all_frameworks(self, frameworks: Optional[List[str]] = None, executions: int = 1) -> List[BenchmarkResult]:
-        """Run benchmarks for all or specified frameworks."""
+    def run_all_frameworks(self, frameworks: Optional[List[str]] = None, executions: int = 1,
+                           on_start: Optional[Callable[[str], None]] = None,
+                           on_result: Optional[Callable[[BenchmarkResult], None]] = None) -> List[BenchmarkResult]:
+        """Run benchmarks for all or specified frameworks.
+        
+        on_start is called with the framework before each execution, and on_result
+        with its result after, e.g. to drive a progress bar.
+        """
         if frameworks is None:
             frameworks = [fw["id"] for fw in self.frameworks]
+        else:
+            frameworks = [sys.intern(framework) for framework in frameworks]
         
         execution_text = f" ({executions} executions each)" if executions > 1 else ""
-        show_header(f"{self.benchmark_name} Benchmark", 
-                   f"Running {self.benchmark_name.lower()} benchmarks for {len(frameworks)} frameworks{execution_text}")
+        show_header(f"{self._benchmark_name} Benchmark", 
+                   f"Running {self._benchmark_name_lower} benchmarks for {len(frameworks)} frameworks{execution_text}")
         
         # Check server is running
         if not self.check_server_health():
@@ -100,55 +355,119 @@ class BenchmarkRunner(ABC):
         
         console.print(f"✅ Server is running at {self.server_config.get('baseUrl')}")
         
+        self._on_start, self._on_result = on_start, on_result
         try:
-            # Run benchmarks
-            for framework in frameworks:
-                try:
-                    if executions == 1:
-                        console.print(f"\n🔄 Running {self.benchmark_name} for [bold]{framework}[/bold]...")
-                        result = self.run_single_benchmark(framework)
-                        self.results.append(result)
-                        
-                        if result.success:
-                            console.print(f"✅ Completed {framework}")
-                        else:
-                            console.print(f"❌ Failed {framework}: {result.error_message}")
-                    else:
-                        console.print(f"\n🔄 Running {self.benchmark_name} for [bold]{framework}[/bold] ({executions} executions)...")
-                        result = self.run_multiple_executions(framework, executions)
-                        self.results.append(result)
-                        
-                        if result.success:
-                            console.print(f"✅ Completed {framework} (averaged from {executions} runs)")
-                        else:
-                            console.print(f"❌ Failed {framework}: {result.error_message}")
-                        
-                except Exception as e:
-                    error_result = BenchmarkResult(framework, self.benchmark_name, {})
-                    error_result.mark_failed(str(e))
-                    self.results.append(error_result)
-                    console.print(f"❌ Error with {framework}: {e}")
+            # Run benchmarks, concurrently where the runner allows it
+            if executions == 1 and self.parallelism > 1 and not self.requires_serial:
+                self.results.extend(self._run_frameworks_parallel(frameworks))
+            else:
+                for framework in frameworks:
+                    self.results.append(self._run_framework(framework, executions))
         
         finally:
+            self._on_start = self._on_result = None
             # Cleanup if benchmark runner supports it
             if hasattr(self, 'cleanup'):
                 self.cleanup()
+            if self._http_session is not None:
+                self._http_session.close()
         
         return self.results
     
+    def _run_framework(self, framework: str, executions: int) -> BenchmarkResult:
+        """Run the benchmark for one framework, converting any exception to a failed result."""
+        try:
+            if executions == 1:
+                console.print(f"\n🔄 Running {self._benchmark_name} for [bold]{framework}[/bold]...")
+                result = self._run_single(framework)
+                
+                if result.success:
+                    console.print(f"✅ Completed {framework}")
+                else:
+                    console.print(f"❌ Failed {framework}: {result.error_message}")
+            else:
+                console.print(f"\n🔄 Running {self._benchmark_name} for [bold]{framework}[/bold] ({executions} executions)...")
+                result = self.run_multiple_executions(framework, executions)
+                
+                if result.success:
+                    console.print(f"✅ Completed {framework} (averaged from {executions} runs)")
+                else:
+                    console.print(f"❌ Failed {framework}: {result.error_message}")
+            
+            return result
+        
+        except Exception as e:
+            error_result = BenchmarkResult(framework, self._benchmark_name, {})
+            error_result.mark_failed(str(e))
+            console.print(f"❌ Error with {framework}: {e}")
+            return error_result
+    
+    def _run_single(self, framework: str) -> BenchmarkResult:
+        """Run one execution of the benchmark, reporting it to the progress callbacks."""
+        if self._on_start is not None:
+            self._on_start(framework)
+        result = self._run_single_cached(framework)
+        if self._on_result is not None:
+            self._on_result(result)
+        return result
+    
+    def _result_cache_inputs(self, framework: str) -> Optional[Path]:
+        """Directory whose files alone determine a framework's result, if it can be cached."""
+        return None
+    
+    def _run_single_cached(self, framework: str) -> BenchmarkResult:
+        """Run the benchmark, reusing the cached result if its inputs are unchanged."""
+        inputs = self._result_cache_inputs(framework) if self.use_result_cache else None
+        if inputs is None:
+            return self.run_single_benchmark(framework)
+        
+        # Include the benchmark code, so changing how results are computed invalidates them
+        digest = hashlib.blake2b(self._result_cache_salt.encode(), digest_size=16)
+        runner_file = getattr(sys.modules.get(type(self).__module__), "__file__", None)
+        for code_path in filter(None, (str(_HERE), runner_file)):
+            stat = os.stat(code_path)
+            digest.update(f"{os.path.basename(code_path)}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+        _tree_fingerprint(inputs, digest)
+        key = digest.hexdigest()
+        
+        cache_path = RESULT_CACHE_DIR / self._benchmark_slug / f"{framework}.json"
+        try:
+            entry = _load_json(cache_path)
+            if entry.get("key") == key:
+                return BenchmarkResult(framework, self._benchmark_name, entry["data"])
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        
+        result = self.run_single_benchmark(framework)
+        if result.success:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                _dump_json(cache_path, {"key": key, "data": result.data})
+            except OSError as e:
+                console.print(f"[yellow]Warning: Failed to cache {framework} result: {e}[/yellow]")
+        return result
+    
+    def _run_frameworks_parallel(self, frameworks: List[str]) -> List[BenchmarkResult]:
+        """Run single-execution benchmarks across a bounded thread pool."""
+        with ThreadPoolExecutor(max_workers=self.parallelism) as executor:
+            futures = [executor.submit(self._run_framework, framework, 1) for framework in frameworks]
+            # Collect in submission order so results match the requested framework order
+            return [future.result() for future in futures]
+    
     def run_multiple_executions(self, framework: str, executions: int) -> BenchmarkResult:
         """Run multiple executions of a benchmark and average the results."""
         successful_results = []
         failed_results = []
         
         for execution in range(executions):
-            console.print(f"   [dim]Execution {execution + 1}/{executions}...[/dim]")
+            # Stop early if every run so far has failed, as the framework is likely broken
+            if not successful_results and self.fail_fast_after and len(failed_results) >= self.fail_fast_after:
+                console.print(f"   [yellow]⚠[/yellow] Skipping remaining {executions - execution} runs after {len(failed_results)} failures with no successful run")
+                break
             
-            # Clear browser cache between runs for accuracy
-            if hasattr(self, '_clear_browser_cache'):
-                self._clear_browser_cache()
+            console.print(f"   [dim]Execution {execution + 1}/{executions}...[/dim]")
             
-            result = self.run_single_benchmark(framework)
+            result = self._run_single(framework)
             
             if result.success:
                 successful_results.append(result)
@@ -159,7 +478,7 @@ class BenchmarkRunner(ABC):
         
         # If we have no successful results, return the first failure
         if not successful_results:
-            return failed_results[0] if failed_results else BenchmarkResult(framework, self.benchmark_name, {})
+            return failed_results[0] if failed_results else BenchmarkResult(framework, self._benchmark_name, {})
         
         # Average the successful results
         return self._average_results(framework, successful_results, len(failed_results))
@@ -167,7 +486,7 @@ class BenchmarkRunner(ABC):
     def _average_results(self, framework: str, results: List[BenchmarkResult], failed_count: int) -> BenchmarkResult:
         """Average multiple benchmark results with statistical analysis."""
         if not results:
-            return BenchmarkResult(framework, self.benchmark_name, {})
+            return BenchmarkResult(framework, self._benchmark_name, {})
         
         # Start with the first result as template
         averaged_data = results[0].data.copy()
@@ -179,14 +498,15 @@ class BenchmarkRunner(ABC):
             for score_name in averaged_data["scores"]:
                 values = [r.data["scores"][score_name] for r in results if score_name in r.data.get("scores", {})]
                 if values:
-                    avg_score = round(sum(values) / len(values), 1)
-                    averaged_data["scores"][score_name] = avg_score
+                    mean, low, high, std_dev = self._calculate_stats(values)
+                    averaged_data["scores"][score_name] = round(mean, 1)
                     
                     # Calculate statistics
                     score_stats[score_name] = {
-                        "min": round(min(values), 1),
-                        "max": round(max(values), 1),
-                        "std_dev": round(self._calculate_std_dev(values), 2) if len(values) > 1 else 0.0
+                        "min": round(low, 1),
+                        "max": round(high, 1),
+                        "median": round(median(values), 1),
+                        "std_dev": round(std_dev, 2)
                     }
             
             if score_stats:
@@ -196,49 +516,47 @@ class BenchmarkRunner(ABC):
         if "metrics" in averaged_data:
             metric_stats = {}
             for metric_name in averaged_data["metrics"]:
-                # Average numeric values
+                # Collect numeric values, scores and the first display value in one pass
                 numeric_values = []
-                display_values = []
                 score_values = []
+                first_display_value = None
                 
                 for result in results:
-                    if metric_name in result.data.get("metrics", {}):
-                        metric = result.data["metrics"][metric_name]
-                        if metric.get("value") is not None:
-                            numeric_values.append(metric["value"])
-                        if metric.get("score") is not None:
-                            score_values.append(metric["score"])
-                        if metric.get("displayValue"):
-                            display_values.append(metric["displayValue"])
+                    metric = result.data.get("metrics", {}).get(metric_name)
+                    if metric is None:
+                        continue
+                    if metric.get("value") is not None:
+                        numeric_values.append(metric["value"])
+                    if metric.get("score") is not None:
+                        score_values.append(metric["score"])
+                    if first_display_value is None and metric.get("displayValue"):
+                        first_display_value = metric["displayValue"]
                 
                 if numeric_values:
-                    avg_value = sum(numeric_values) / len(numeric_values)
+                    avg_value, low, high, std_dev = self._calculate_stats(numeric_values)
                     averaged_data["metrics"][metric_name]["value"] = avg_value
                     
                     # Calculate statistics for this metric
                     metric_stats[metric_name] = {
-                        "min": round(min(numeric_values), 2),
-                        "max": round(max(numeric_values), 2),
-                        "std_dev": round(self._calculate_std_dev(numeric_values), 2) if len(numeric_values) > 1 else 0.0
+                        "min": round(low, 2),
+                        "max": round(high, 2),
+                        "median": round(median(numeric_values), 2),
+                        "std_dev": round(std_dev, 2)
                     }
                     
-                    # Update display value based on averaged numeric value
-                    if display_values and "s" in display_values[0]:  # Time in seconds
-                        averaged_data["metrics"][metric_name]["displayValue"] = f"{avg_value / 1000:.1f}\u00a0s"
-                    elif display_values and "ms" in display_values[0]:  # Time in milliseconds
-                        averaged_data["metrics"][metric_name]["displayValue"] = f"{avg_value:.0f}\u00a0ms"
-                    else:  # Other metrics (like CLS)
-                        averaged_data["metrics"][metric_name]["displayValue"] = f"{avg_value:.3f}"
+                    # Update display value based on averaged numeric value, in the first run's unit
+                    unit = _display_unit(first_display_value) if first_display_value else None
+                    averaged_data["metrics"][metric_name]["displayValue"] = _UNIT_FORMATTERS[unit](avg_value)
                 
                 if score_values:
-                    avg_score = sum(score_values) / len(score_values)
+                    avg_score, low, high, std_dev = self._calculate_stats(score_values)
                     averaged_data["metrics"][metric_name]["score"] = avg_score
                     
                     # Add score statistics to the existing metric stats
                     if metric_name in metric_stats:
-                        metric_stats[metric_name]["score_min"] = round(min(score_values), 3)
-                        metric_stats[metric_name]["score_max"] = round(max(score_values), 3)
-                        metric_stats[metric_name]["score_std_dev"] = round(self._calculate_std_dev(score_values), 3) if len(score_values) > 1 else 0.0
+                        metric_stats[metric_name]["score_min"] = round(low, 3)
+                        metric_stats[metric_name]["score_max"] = round(high, 3)
+                        metric_stats[metric_name]["score_std_dev"] = round(std_dev, 3)
             
             if metric_stats:
                 statistics["metrics"] = metric_stats
@@ -252,16 +570,30 @@ class BenchmarkRunner(ABC):
             "statistics": statistics
         }
         
-        return BenchmarkResult(framework, self.benchmark_name, averaged_data)
+        return BenchmarkResult(framework, self._benchmark_name, averaged_data)
     
-    def _calculate_std_dev(self, values: List[float]) -> float:
-        """Calculate standard deviation of a list of values."""
-        if len(values) <= 1:
-            return 0.0
-        
-        mean = sum(values) / len(values)
-        variance = sum((x - mean) ** 2 for x in values) / (len(values) - 1)
-        return variance ** 0.5
+    def _calculate_stats(self, values: List[float]) -> Tuple[float, float, float, float]:
+        """Calculate mean, min, max and standard deviation of a non-empty list of values.
+        
+        Uses Welford's online algorithm, so every statistic comes from a single pass.
+        """
+        count = 0
+        mean = 0.0
+        sum_sq_diff = 0.0
+        low = high = values[0]
+        
+        for value in values:
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            sum_sq_diff += delta * (value - mean)
+            if value < low:
+                low = value
+            elif value > high:
+                high = value
+        
+        std_dev = math.sqrt(sum_sq_diff / (count - 1)) if count > 1 else 0.0
+        return mean, low, high, std_dev
     
     def save_results(self, results: Optional[List[BenchmarkResult]] = None, run_id: Optional[str] = None) -> Path:
         """Save benchmark results to file with enhanced metadata for programmatic access."""
@@ -269,32 +601,36 @@ class BenchmarkRunner(ABC):
             results = self.results
         
         # Create output directory with date-based organization
-        project_root = Path(__file__).parent.parent.parent  # scripts/benchmark/ -> project root
-        base_output_dir = project_root / self.output_config.get("directory", "benchmark-results")
+        base_output_dir = _PROJECT_ROOT / self.output_config.get("directory", "benchmark-results")
         
         # Ensure the benchmark-results directory exists
         base_output_dir.mkdir(parents=True, exist_ok=True)
         
+        # Snapshot the clock once so the date, file name, run id and timestamps all agree
+        now = datetime.now()
+        timestamp_iso = now.isoformat()
+        
         # Create date-based subdirectory for better organization
-        date_str = datetime.now().strftime("%Y-%m-%d")
+        date_str = now.strftime("%Y-%m-%d")
         output_dir = base_output_dir / date_str
         output_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate filename with timestamp
-        timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{self.benchmark_name.lower().replace(' ', '_')}_{timestamp_str}.json"
+        timestamp_str = now.strftime("%Y%m%d_%H%M%S")
+        filename = f"{self._benchmark_slug}_{timestamp_str}.json"
         output_path = output_dir / filename
         
-        # Extract framework list and success/failure counts for metadata
-        frameworks_tested = [r.framework for r in results]
-        successful_frameworks = [r.framework for r in results if r.success]
-        failed_frameworks = [r.framework for r in results if not r.success]
+        # Extract framework list and success/failure split in one pass
+        frameworks_tested, successful_frameworks, failed_frameworks = [], [], []
+        for result in results:
+            frameworks_tested.append(result.framework)
+            (successful_frameworks if result.success else failed_frameworks).append(result.framework)
         
         # Enhanced output data with metadata for programmatic access
         output_data = {
-            "benchmark_type": self.benchmark_name,
-            "benchmark_slug": self.benchmark_name.lower().replace(' ', '_'),
-            "timestamp": datetime.now().isoformat(),
+            "benchmark_type": self._benchmark_name,
+            "benchmark_slug": self._benchmark_slug,
+            "timestamp": timestamp_iso,
             "date": date_str,
             "run_id": run_id or f"run_{timestamp_str}",
             "metadata": {
@@ -304,15 +640,14 @@ class BenchmarkRunner(ABC):
                 "failed_count": len(failed_frameworks),
                 "successful_frameworks": successful_frameworks,
                 "failed_frameworks": failed_frameworks,
-                "execution_time_iso": datetime.now().isoformat(),
-                "file_path": str(output_path.relative_to(project_root))
+                "execution_time_iso": timestamp_iso,
+                "file_path": str(output_path.relative_to(_PROJECT_ROOT))
             },
-            "config": self.benchmark_config.get(self.benchmark_name.lower(), {}),
-            "results": [result.to_dict() for result in results]
+            "config": self._benchmark_type_config,
+            "results": results  # Serialized by _json_default
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(output_data, f, indent=2)
+        _dump_json(output_path, output_data)
         
         # Update index files for easy discovery
         self._update_index_files(output_dir, base_output_dir, output_data, output_path)
@@ -320,13 +655,15 @@ class BenchmarkRunner(ABC):
         return output_path
     
     def _update_index_files(self, date_dir: Path, base_dir: Path, run_data: Dict, result_file: Path):
-        """Update index files for easier programmatic discovery."""
+        """Update index files for easier programmatic discovery.
         
-        # Create daily index
-        daily_index_path = date_dir / "index.json"
-        daily_index = self._load_or_create_index(daily_index_path)
+        Each run is appended as one line to the daily index.ndjson log, so saving
+        never has to re-read or rewrite a growing index. A small latest.json keeps
+        the most recent run per benchmark type, and compact_index() can rebuild the
+        full index.json files from the logs on demand.
+        """
         
-        # Add this benchmark to daily index
+        # Append this benchmark to the daily index log
         benchmark_entry = {
             "benchmark_type": run_data["benchmark_slug"],
             "timestamp": run_data["timestamp"],
@@ -336,63 +673,35 @@ class BenchmarkRunner(ABC):
             "failed_count": run_data["metadata"]["failed_count"],
             "file": result_file.name
         }
+        _append_json_line(date_dir / DAILY_INDEX_LOG, benchmark_entry)
         
-        # Update daily index
-        if "benchmarks" not in daily_index:
-            daily_index["benchmarks"] = []
-        
-        # Remove existing entry for this benchmark type (if re-run)
-        daily_index["benchmarks"] = [b for b in daily_index["benchmarks"] 
-                                    if b["benchmark_type"] != run_data["benchmark_slug"]]
-        daily_index["benchmarks"].append(benchmark_entry)
-        daily_index["last_updated"] = run_data["timestamp"]
-        daily_index["date"] = run_data["date"]
-        
-        with open(daily_index_path, 'w') as f:
-            json.dump(daily_index, f, indent=2)
-        
-        # Create/update global index
-        global_index_path = base_dir / "index.json"
-        global_index = self._load_or_create_index(global_index_path)
+        # Update latest results tracking, which stays one entry per benchmark type
+        latest_path = base_dir / LATEST_INDEX_FILE
+        latest_index = self._load_or_create_index(latest_path)
         
-        # Track available dates and benchmark types
-        if "available_dates" not in global_index:
-            global_index["available_dates"] = []
-        if "available_benchmark_types" not in global_index:
-            global_index["available_benchmark_types"] = []
+        if "latest_results" not in latest_index:
+            latest_index["latest_results"] = {}
         
-        if run_data["date"] not in global_index["available_dates"]:
-            global_index["available_dates"].append(run_data["date"])
-            global_index["available_dates"].sort(reverse=True)  # Most recent first
-        
-        if run_data["benchmark_slug"] not in global_index["available_benchmark_types"]:
-            global_index["available_benchmark_types"].append(run_data["benchmark_slug"])
-            global_index["available_benchmark_types"].sort()
-        
-        # Update latest results tracking
-        if "latest_results" not in global_index:
-            global_index["latest_results"] = {}
-        
-        global_index["latest_results"][run_data["benchmark_slug"]] = {
+        latest_index["latest_results"][run_data["benchmark_slug"]] = {
             "date": run_data["date"],
             "timestamp": run_data["timestamp"],
             "file": str(result_file.relative_to(base_dir)),
             "frameworks_count": run_data["metadata"]["frameworks_count"],
             "successful_count": run_data["metadata"]["successful_count"]
         }
+        latest_index["last_updated"] = run_data["timestamp"]
         
-        global_index["last_updated"] = run_data["timestamp"]
-        
-        with open(global_index_path, 'w') as f:
-            json.dump(global_index, f, indent=2)
+        # Write to a temp file and rename, so readers never see a partial file
+        tmp_path = latest_path.with_name(latest_path.name + ".tmp")
+        _dump_json(tmp_path, latest_index)
+        os.replace(tmp_path, latest_path)
     
     def _load_or_create_index(self, index_path: Path) -> Dict:
         """Load existing index or create new one."""
         if index_path.exists():
             try:
-                with open(index_path, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+                return _load_json(index_path)
+            except (ValueError, IOError):
                 pass
         return {}
     
@@ -406,16 +715,17 @@ class BenchmarkRunner(ABC):
             return
         
         # Create summary table
-        table = Table(title=f"{self.benchmark_name} Benchmark Summary")
+        table = Table(title=f"{self._benchmark_name} Benchmark Summary")
         table.add_column("Framework", style="bold")
         table.add_column("Status", justify="center")
         
         # Add benchmark-specific columns
         self._add_summary_columns(table)
         
-        # Add rows
+        # Add rows, with failed frameworks showing a dash in every benchmark column
         successful_results = []
         failed_results = []
+        dash_cells = ["—"] * (len(table.columns) - 2)
         
         for result in results:
             if result.success:
@@ -425,7 +735,7 @@ class BenchmarkRunner(ABC):
                 table.add_row(*row)
             else:
                 failed_results.append(result)
-                table.add_row(result.framework, "❌ Fail", *["—"] * (table.columns.__len__() - 2))
+                table.add_row(result.framework, "❌ Fail", *dash_cells)
         
         console.print(table)
         
@@ -1,73 +1,76 @@
 #!/usr/bin/env python3
 """Build time benchmarking for web application frameworks."""
 
-import json
 import os
 import shutil
 import subprocess
-import tempfile
 import time
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from rich.console import Console
 from rich.table import Table
 
 from base import BenchmarkRunner, BenchmarkResult
+from common import console
 
-console = Console()
+
+# Build cache directories removed before each build to force a complete rebuild
+CACHE_DIRS = (
+    "node_modules/.vite",      # Vite cache
+    "node_modules/.cache",     # General build cache
+    ".angular",                # Angular cache
+    "dist/.cache",             # Some build caches
+    ".svelte-kit",             # SvelteKit cache
+)
 
 
 class BuildTimeRunner(BenchmarkRunner):
     """Build time benchmark runner."""
     
+    # Concurrent builds compete for CPU and disk, inflating the wall-clock times being measured
+    requires_serial = True
+    
     @property
     def benchmark_name(self) -> str:
         return "Build Time"
     
-    def __init__(self, clean_build: bool = True):
+    def __init__(self, clean_build: bool = True, concurrency: Optional[int] = None):
         super().__init__()
-        self.frameworks_config = self._load_frameworks_config()
         # Always use clean builds for accurate results
         self.clean_build = True
+        # Builds are independent subprocesses in separate app dirs, so several can run at once
+        # when configured, leaving half the cores free so they don't starve each other
+        if concurrency is None:
+            concurrency = self.benchmark_config.get("buildTime", {}).get("concurrency", 1)
+        self.concurrency = min(max(1, int(concurrency)), max(1, (os.cpu_count() or 2) // 2))
+        if self.concurrency > 1:
+            self.requires_serial = False
+            self.parallelism = self.concurrency
     
     def check_server_health(self) -> bool:
         """Build time measurement doesn't require a running server."""
         return True
     
-    def _load_frameworks_config(self) -> Dict:
-        """Load frameworks configuration."""
-        config_path = Path(__file__).parent.parent.parent / "frameworks.json"
-        try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            console.print(f"[red]Failed to load frameworks.json: {e}[/red]")
-            return {"frameworks": []}
-    
     def _get_framework_config(self, framework_id: str) -> Optional[Dict]:
         """Get configuration for a specific framework."""
-        for fw in self.frameworks_config.get("frameworks", []):
-            if fw["id"] == framework_id:
-                return fw
-        return None
+        return self._frameworks_by_id.get(framework_id)
     
     def _backup_build_output(self, framework_dir: Path, build_dir: str) -> Optional[Path]:
-        """Backup existing build output if it exists."""
+        """Move existing build output aside so the benchmark can build from scratch."""
         build_path = framework_dir / build_dir
-        if not build_path.exists():
+        if not build_path.exists() or build_path.resolve() == framework_dir.resolve():
             return None
         
-        # Create temporary backup
-        backup_dir = tempfile.mkdtemp(prefix=f"build-backup-{framework_dir.name}-")
-        backup_path = Path(backup_dir)
+        # Rename to a sibling, which is O(1) on the same filesystem unlike copying the tree
+        backup_path = build_path.with_name(f"{build_path.name}.bak-{os.getpid()}")
         
         try:
-            shutil.copytree(build_path, backup_path / build_dir)
+            if backup_path.exists():
+                shutil.rmtree(backup_path)
+            os.rename(build_path, backup_path)
             return backup_path
-        except Exception as e:
+        except OSError as e:
             console.print(f"[yellow]Warning: Failed to backup {build_path}: {e}[/yellow]")
-            shutil.rmtree(backup_dir, ignore_errors=True)
             return None
     
     def _restore_build_output(self, framework_dir: Path, build_dir: str, backup_path: Optional[Path]):
@@ -76,19 +79,13 @@ class BuildTimeRunner(BenchmarkRunner):
             return
         
         build_path = framework_dir / build_dir
-        backup_build_path = backup_path / build_dir
         
         try:
-            # Remove current build output
+            # Remove the benchmark's build output and move the original back; the backup
+            # is a sibling of the build dir, so this is always a same-filesystem rename
             if build_path.exists():
                 shutil.rmtree(build_path)
-            
-            # Restore from backup
-            if backup_build_path.exists():
-                shutil.copytree(backup_build_path, build_path)
-            
-            # Clean up backup
-            shutil.rmtree(backup_path, ignore_errors=True)
+            os.rename(backup_path, build_path)
         except Exception as e:
             console.print(f"[yellow]Warning: Failed to restore {build_path}: {e}[/yellow]")
     
@@ -103,24 +100,23 @@ class BuildTimeRunner(BenchmarkRunner):
             except Exception as e:
                 console.print(f"[yellow]Warning: Failed to clean {build_path}: {e}[/yellow]")
         
-        # Clean common cache directories to force complete rebuild
-        cache_dirs = [
-            "node_modules/.vite",      # Vite cache
-            "node_modules/.cache",     # General build cache
-            ".angular",                # Angular cache
-            "dist/.cache",             # Some build caches
-            ".svelte-kit",             # SvelteKit cache
-        ]
+        # Clean common cache directories to force complete rebuild, reading the app
+        # directory once rather than stat-ing every candidate cache path
+        try:
+            with os.scandir(framework_dir) as entries:
+                existing = {entry.name for entry in entries if entry.is_dir()}
+        except OSError:
+            return
         
-        for cache_dir in cache_dirs:
-            cache_path = framework_dir / cache_dir
-            if cache_path.exists():
-                try:
-                    shutil.rmtree(cache_path)
-                    console.print(f"[dim]🧹 {framework_dir.name}: Cleaned {cache_dir}/ cache[/dim]")
-                except Exception as e:
-                    # Cache cleaning failures are not critical
-                    pass
+        for cache_dir in CACHE_DIRS:
+            if cache_dir.split("/", 1)[0] not in existing:
+                continue
+            try:
+                shutil.rmtree(framework_dir / cache_dir)
+                console.print(f"[dim]🧹 {framework_dir.name}: Cleaned {cache_dir}/ cache[/dim]")
+            except Exception:
+                # Missing nested caches and cleaning failures are not critical
+                pass
     
     def run_single_benchmark(self, framework: str) -> BenchmarkResult:
         """Measure build time for a single framework."""
@@ -137,20 +133,7 @@ class BuildTimeRunner(BenchmarkRunner):
             elif build_command == "ng build":
                 build_command = "npx ng build"
             # Find apps directory - look from project root
-            apps_dir = None
-            script_dir = Path(__file__).parent
-            project_root = script_dir.parent.parent  # Go up from scripts/benchmark/ to project root
-            
-            for possible_path in [
-                project_root / "apps",    # From project root
-                Path("../../apps"),       # Relative from scripts/benchmark/
-                Path("apps"),             # From current working directory
-                Path("./apps")            # Alternative current directory
-            ]:
-                if possible_path.exists():
-                    apps_dir = possible_path.resolve()  # Get absolute path
-                    break
-            
+            apps_dir = self._get_apps_dir()
             if not apps_dir:
                 return self._create_error_result(framework, "Could not find apps directory")
             
@@ -180,20 +163,22 @@ class BuildTimeRunner(BenchmarkRunner):
                 self._clean_build_output(framework_dir, build_dir)
                 
                 # Measure build time
+                args, needs_shell = self._prepare_command(build_command)
                 console.print(f"[dim]🔨 {framework}: Running build command...[/dim]")
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
                 
                 result = subprocess.run(
-                    build_command,
-                    shell=True,
+                    args,
+                    shell=needs_shell,
                     cwd=framework_dir,
                     capture_output=True,
                     text=True,
                     timeout=300  # 5 minute timeout
                 )
                 
-                end_time = time.time()
-                build_time = end_time - start_time
+                # Monotonic clock, so NTP adjustments can't skew the measurement
+                build_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+                build_time = build_time_ms / 1000
                 
                 # Check if build was successful
                 if result.returncode != 0:
@@ -210,7 +195,7 @@ class BuildTimeRunner(BenchmarkRunner):
                 return BenchmarkResult(framework, self.benchmark_name, {
                     "framework": framework,
                     "build_command": build_command,
-                    "build_time_ms": int(build_time * 1000),
+                    "build_time_ms": build_time_ms,
                     "build_time_seconds": round(build_time, 2),
                     "status": "success",
                     "output_size_mb": round(output_size / (1024 * 1024), 2),
@@ -234,15 +219,22 @@ class BuildTimeRunner(BenchmarkRunner):
         if not build_path.exists():
             return 0
         
+        # Walk with scandir, whose entries carry cached stat data from the directory read
         total_size = 0
-        try:
-            for root, dirs, files in os.walk(build_path):
-                for file in files:
-                    file_path = Path(root) / file
-                    if file_path.exists():
-                        total_size += file_path.stat().st_size
-        except Exception:
-            pass
+        stack = [str(build_path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file():
+                                total_size += entry.stat().st_size
+                        except OSError:
+                            continue
+            except OSError:
+                continue
         
         return total_size
     
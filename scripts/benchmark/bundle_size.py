@@ -1,38 +1,156 @@
 #!/usr/bin/env python3
 """Bundle size analysis for all frameworks."""
 
-import gzip
+import hashlib
+import json
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
-from rich.console import Console
 from rich.table import Table
 
 from base import BenchmarkRunner, BenchmarkResult
+from common import console
 
-console = Console()
+try:
+    # zlib-ng is a drop-in, SIMD-accelerated zlib that is several times faster at level 9
+    from zlib_ng import zlib_ng as zlib
+    GZIP_BACKEND = "zlib-ng"
+except ImportError:  # zlib-ng is optional, fall back to the stdlib zlib
+    import zlib
+    GZIP_BACKEND = "zlib"
+
+
+# Read size for streaming files through the compressor
+_CHUNK_SIZE = 1 << 20
+
+# Development, dependency and shared asset directories skipped when finding bundle files
+EXCLUDED_DIRS = frozenset({
+    "node_modules", ".git", ".vscode", "coverage", "test-results",
+    "playwright-report", ".svelte-kit", ".angular", ".next",
+    "public", "static", "mocks", "icons", "styles"
+})
+
+# Shared asset files that are identical across all frameworks
+SHARED_ASSETS = frozenset({
+    "base.css", "components.css", "design-system.css", "variables.css",
+    "favicon.ico", "favicon.png", "logo.png", "screenshot.png",
+    "weather-data.json", "index.html"
+})
+
+# A bundle file path with the stat result taken while walking the build directory
+FileStat = Tuple[str, os.stat_result]
+
+
+def _gzip_size_worker(file_path: str) -> int:
+    """Get the gzipped size of a file.
+    
+    Defined at module level so it can be pickled and run in a worker process.
+    """
+    try:
+        # Stream through a gzip-framed deflate (wbits=31, level 9 as gzip.compress uses)
+        # and only count output bytes, so neither the file nor its compressed form is held
+        compressor = zlib.compressobj(9, zlib.DEFLATED, 31)
+        gzipped_size = 0
+        # Read into one reused buffer instead of allocating a new bytes object per chunk
+        buffer = bytearray(_CHUNK_SIZE)
+        view = memoryview(buffer)
+        with open(file_path, 'rb', buffering=0) as f:
+            while n := f.readinto(buffer):
+                gzipped_size += len(compressor.compress(view[:n]))
+        gzipped_size += len(compressor.flush())
+    except Exception:
+        gzipped_size = 0
+    return gzipped_size
+
+
+def _file_digest(file_path: str) -> Optional[bytes]:
+    """Hash a file's contents, or return None if it can't be read."""
+    digest = hashlib.blake2b(digest_size=16)
+    buffer = bytearray(_CHUNK_SIZE)
+    view = memoryview(buffer)
+    try:
+        with open(file_path, 'rb', buffering=0) as f:
+            while n := f.readinto(buffer):
+                digest.update(view[:n])
+    except OSError:
+        return None
+    return digest.digest()
 
 
 class BundleSizeRunner(BenchmarkRunner):
     """Bundle size benchmark runner."""
     
+    # Gzip backends can differ by a few bytes, so cached results are kept per backend
+    _result_cache_salt = GZIP_BACKEND
+    averages_executions = False
+    
     @property
     def benchmark_name(self) -> str:
         return "Bundle Size"
     
     def __init__(self):
         super().__init__()
-        self.project_root = Path(__file__).parent.parent.parent
+        # Gzipped sizes from previous runs, keyed by path and validated by mtime + size.
+        # Backends can differ by a few bytes, so each keeps its own cache.
+        self._gzip_cache_path = self.project_root / ".bench_cache" / f"gzip-{GZIP_BACKEND}.json"
+        self._gzip_cache = self._load_gzip_cache()
+        self._gzip_cache_lock = threading.Lock()
+        # Gzipped sizes computed this run, keyed by content hash so identical files compress once
+        self._gzip_by_digest: Dict[bytes, int] = {}
+        
+        # Compression worker pool, created on first cache miss and shared by all frameworks
+        self._gzip_pool = None
+        self._gzip_pool_lock = threading.Lock()
+    
+    def _get_gzip_pool(self) -> ProcessPoolExecutor:
+        """Get the shared compression pool, starting it if needed."""
+        with self._gzip_pool_lock:
+            if self._gzip_pool is None:
+                self._gzip_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+            return self._gzip_pool
+    
+    def cleanup(self):
+        """Shut down the compression pool."""
+        if self._gzip_pool is not None:
+            self._gzip_pool.shutdown(wait=True)
+            self._gzip_pool = None
+    
+    def _load_gzip_cache(self) -> Dict[str, List[int]]:
+        """Load the persistent gzip size cache, starting empty if it's missing or corrupt."""
+        try:
+            with open(self._gzip_cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_gzip_cache(self):
+        """Write the gzip size cache atomically, as frameworks may finish concurrently."""
+        with self._gzip_cache_lock:
+            try:
+                self._gzip_cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self._gzip_cache_path.with_name(f"{self._gzip_cache_path.name}.{threading.get_ident()}.tmp")
+                with open(tmp_path, 'w') as f:
+                    json.dump(self._gzip_cache, f, separators=(',', ':'))
+                os.replace(tmp_path, self._gzip_cache_path)
+            except OSError as e:
+                console.print(f"[yellow]Warning: Failed to save gzip cache: {e}[/yellow]")
     
     def check_server_health(self) -> bool:
         """Bundle size analysis doesn't require a server."""
         return True
     
+    def _result_cache_inputs(self, framework: str) -> Optional[Path]:
+        """Bundle sizes depend only on the framework's build output."""
+        return self._find_build_directory(self.project_root / "apps" / framework, framework)
+    
     def run_single_benchmark(self, framework: str) -> BenchmarkResult:
         """Analyze bundle size for a single framework."""
         try:
             bundle_data = self._analyze_framework_bundle(framework)
+            self._save_gzip_cache()
             return BenchmarkResult(framework, self.benchmark_name, bundle_data)
         except Exception as e:
             return self._create_error_result(framework, f"Bundle analysis failed: {str(e)}")
@@ -47,18 +165,11 @@ class BundleSizeRunner(BenchmarkRunner):
             raise FileNotFoundError(f"No build directory found for {framework}")
         
         # Analyze all JavaScript and CSS files
-        js_files = self._find_files(build_dir, [".js"])
-        css_files = self._find_files(build_dir, [".css"])
-        
-        # Calculate sizes excluding shared assets
-        js_data = self._analyze_files(js_files, framework)
-        css_data = self._analyze_files(css_files, framework)
+        js_files, css_files = self._find_bundle_files(build_dir)
         
-        # Calculate totals
-        total_js_size = sum(f["size"] for f in js_data)
-        total_js_gzipped = sum(f["gzipped_size"] for f in js_data)
-        total_css_size = sum(f["size"] for f in css_data)
-        total_css_gzipped = sum(f["gzipped_size"] for f in css_data)
+        # Calculate sizes and totals excluding shared assets
+        js_data, total_js_size, total_js_gzipped = self._analyze_files(js_files, framework)
+        css_data, total_css_size, total_css_gzipped = self._analyze_files(css_files, framework)
         
         return {
             "framework": framework,
@@ -85,7 +196,7 @@ class BundleSizeRunner(BenchmarkRunner):
     def _find_build_directory(self, app_dir: Path, framework: str) -> Path:
         """Find the build/dist directory for a framework."""
         # Get buildDir from frameworks.json
-        framework_config = next((fw for fw in self.frameworks if fw["id"] == framework), None)
+        framework_config = self._frameworks_by_id.get(framework)
         if framework_config and "buildDir" in framework_config:
             build_dir = app_dir / framework_config["buildDir"]
             if build_dir.exists():
@@ -106,74 +217,111 @@ class BundleSizeRunner(BenchmarkRunner):
         
         return None
     
-    def _find_files(self, directory: Path, extensions: List[str]) -> List[Path]:
-        """Find all files with given extensions, excluding shared assets."""
-        files = []
+    def _find_bundle_files(self, directory: Path) -> Tuple[List[FileStat], List[FileStat]]:
+        """Find JS and CSS files with their stat results in one directory walk, excluding shared assets."""
+        js_files, css_files = [], []
+        stack = [str(directory)]
         
-        for ext in extensions:
-            # Recursively search for files in build directory and subdirectories
-            files.extend(directory.rglob(f"*{ext}"))
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        # Skip development, dependency and shared asset directories
+                        if name not in EXCLUDED_DIRS:
+                            stack.append(entry.path)
+                        continue
+                    
+                    # Skip shared asset files that are identical across all frameworks
+                    name_lower = name.lower()
+                    if name_lower in SHARED_ASSETS:
+                        continue
+                    if name.endswith(".js"):
+                        files = js_files
+                    elif name.endswith(".css"):
+                        files = css_files
+                    else:
+                        continue
+                    # Stat through the entry, which is free on Windows where the directory
+                    # read already carries it, and is cached on the entry elsewhere
+                    try:
+                        files.append((entry.path, entry.stat()))
+                    except OSError:
+                        continue
         
-        # Filter out shared assets that are identical across frameworks
-        return [f for f in files if self._is_framework_specific_file(f)]
+        return js_files, css_files
     
-    def _is_framework_specific_file(self, file_path: Path) -> bool:
-        """Check if file is framework-specific (not shared assets)."""
-        file_name = file_path.name.lower()
-        
-        # Skip development and dependency directories
-        excluded_dirs = [
-            "node_modules", ".git", ".vscode", "coverage", "test-results", 
-            "playwright-report", ".svelte-kit", ".angular", ".next", 
-            "public", "static", "mocks", "icons", "styles"
-        ]
+    def _analyze_files(self, files: List[FileStat], framework: str) -> Tuple[List[Dict], int, int]:
+        """Analyze size information for files, returning per-file data and size totals."""
+        file_data = []
+        total_size = 0
+        total_gzipped = 0
         
-        # Skip if file is in excluded directories
-        if any(excluded_dir in file_path.parts for excluded_dir in excluded_dirs):
-            return False
+        # Reuse cached gzipped sizes for files that haven't changed
+        sizes = []
+        misses = []
+        for file_path, stat in files:
+            cache_key = os.path.realpath(file_path)
+            cached = self._gzip_cache.get(cache_key)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                sizes.append([file_path, stat.st_size, cached[2]])
+            else:
+                entry = [file_path, stat.st_size, None]
+                sizes.append(entry)
+                misses.append((entry, cache_key, stat))
         
-        # Skip shared asset files that are identical across all frameworks
-        shared_assets = [
-            "base.css", "components.css", "design-system.css", "variables.css",
-            "favicon.ico", "favicon.png", "logo.png", "screenshot.png",
-            "weather-data.json", "index.html"
-        ]
+        # Group uncached files by content, as identical files (e.g. shared vendor chunks) only
+        # need compressing once. Hashing is far cheaper than level 9 deflate.
+        pending = {}
+        for miss in misses:
+            digest = _file_digest(miss[0][0]) or miss[1]
+            with self._gzip_cache_lock:
+                gzipped_size = self._gzip_by_digest.get(digest)
+            if gzipped_size is None:
+                pending.setdefault(digest, []).append(miss)
+            else:
+                self._store_gzipped_size(miss, gzipped_size)
         
-        # Skip if it's a known shared asset
-        if file_name in shared_assets:
-            return False
+        # Compression is CPU-bound, so spread it across processes rather than threads
+        if pending:
+            gzipped_sizes = self._get_gzip_pool().map(
+                _gzip_size_worker, [group[0][0][0] for group in pending.values()], chunksize=4
+            )
+            for (digest, group), gzipped_size in zip(pending.items(), gzipped_sizes):
+                if gzipped_size > 0:  # Don't cache failed reads
+                    with self._gzip_cache_lock:
+                        self._gzip_by_digest[digest] = gzipped_size
+                for miss in group:
+                    self._store_gzipped_size(miss, gzipped_size)
         
-        return True
-    
-    def _analyze_files(self, files: List[Path], framework: str) -> List[Dict]:
-        """Analyze size information for files."""
-        file_data = []
-        
-        for file_path in files:
-            if not file_path.exists():
-                continue
-            
-            size = file_path.stat().st_size
-            gzipped_size = self._get_gzipped_size(file_path)
-            
+        # Paths stay as plain strings here; a Path per file is measurable overhead on large trees
+        for file_path, size, gzipped_size in sizes:
+            total_size += size
+            total_gzipped += gzipped_size
+            parent_dir, name = os.path.split(file_path)
             file_data.append({
-                "name": file_path.name,
-                "path": str(file_path.relative_to(file_path.parent.parent)),
+                "name": name,
+                "path": os.path.join(os.path.basename(parent_dir), name),
                 "size": size,
                 "gzipped_size": gzipped_size,
                 "compression_ratio": size / gzipped_size if gzipped_size > 0 else 1
             })
         
         # Sort by size descending
-        return sorted(file_data, key=lambda x: x["size"], reverse=True)
+        file_data.sort(key=lambda x: x["size"], reverse=True)
+        return file_data, total_size, total_gzipped
     
-    def _get_gzipped_size(self, file_path: Path) -> int:
-        """Calculate gzipped size of a file."""
-        try:
-            with open(file_path, 'rb') as f:
-                return len(gzip.compress(f.read()))
-        except Exception:
-            return 0
+    def _store_gzipped_size(self, miss: Tuple[list, str, os.stat_result], gzipped_size: int):
+        """Record a freshly computed gzipped size on its entry and in the persistent cache."""
+        entry, cache_key, stat = miss
+        entry[2] = gzipped_size
+        if gzipped_size > 0:  # Don't cache failed reads
+            with self._gzip_cache_lock:
+                self._gzip_cache[cache_key] = [stat.st_mtime_ns, stat.st_size, gzipped_size]
     
     def _create_error_result(self, framework: str, error: str) -> BenchmarkResult:
         """Create a failed benchmark result."""
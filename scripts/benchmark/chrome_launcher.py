@@ -1,82 +1,129 @@
 """Cross-platform Chrome launcher for Lighthouse benchmarks."""
 
+import atexit
 import os
 import platform
+import queue
+import shutil
 import subprocess
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 import requests
-from rich.console import Console
 
-console = Console()
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+from common import console
+
+# Remote debugging port used when only one Chrome is needed
+DEFAULT_DEBUG_PORT = 9222
+
+# Chrome executables to look for, in order of preference, per platform
+CHROME_PATHS = {
+    "linux": (
+        "/usr/bin/google-chrome",
+        "/usr/bin/google-chrome-stable", 
+        "/usr/bin/chromium-browser",
+        "/usr/bin/chromium",
+        "/snap/bin/chromium",
+        "google-chrome",
+        "chromium-browser"
+    ),
+    "darwin": (  # macOS
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+        "/Applications/Chromium.app/Contents/MacOS/Chromium",
+        "google-chrome",
+        "chromium"
+    ),
+    "windows": (
+        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+        r"C:\Users\%USERNAME%\AppData\Local\Google\Chrome\Application\chrome.exe",
+        "chrome.exe",
+        "google-chrome"
+    )
+}
+
+# Platform name used to pick CHROME_PATHS, looked up once
+_SYSTEM = platform.system().lower()
+
+# Chrome started by get_shared_chrome(), reused for every benchmark in this process
+_shared_launcher = None
+# Background connection started by prelaunch_shared_chrome(), if not yet collected
+_prelaunch = None
+
+# Chrome prints this to stderr once the remote debugging port is accepting connections
+DEVTOOLS_READY_MARKER = b"DevTools listening on ws://"
+
+# Flags for a headless Chrome that Lighthouse can drive
+_CHROME_FLAGS = (
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-default-apps",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI",
+    "--disable-component-extensions-with-background-pages",
+)
+
+
+@lru_cache(maxsize=1)
+def _find_chrome_executable() -> Optional[str]:
+    """Search the platform's usual Chrome locations, once per process."""
+    for path in CHROME_PATHS.get(_SYSTEM, CHROME_PATHS["linux"]):
+        # Expand environment variables for Windows paths
+        expanded_path = os.path.expandvars(path)
+        
+        # Search PATH in-process for bare command names, rather than running 'which'
+        if not os.path.isabs(expanded_path):
+            found = shutil.which(expanded_path)
+            if found:
+                return found
+        
+        # Check if absolute path exists
+        if os.path.isfile(expanded_path):
+            return expanded_path
+            
+    return None
 
 
 class ChromeLauncher:
     """Manages Chrome instances for Lighthouse benchmarks."""
     
-    def __init__(self, port: int = 9222):
+    def __init__(self, port: int = DEFAULT_DEBUG_PORT):
         self.port = port
-        self.user_data_dir = Path.cwd() / "tmp" / "chrome-profile"
+        # Separate profiles per port, so several instances can run side by side
+        profile = "chrome-profile" if port == DEFAULT_DEBUG_PORT else f"chrome-profile-{port}"
+        self.user_data_dir = Path.cwd() / "tmp" / profile
         self.process = None
+        self._session = None
         
+    @property
+    def _http(self) -> requests.Session:
+        """Reuse one session so readiness probes share a keep-alive connection."""
+        if self._session is None:
+            self._session = requests.Session()
+        return self._session
+    
     def find_chrome_executable(self) -> Optional[str]:
         """Find Chrome executable across different platforms."""
-        system = platform.system().lower()
-        
-        # Platform-specific Chrome paths
-        chrome_paths = {
-            "linux": [
-                "/usr/bin/google-chrome",
-                "/usr/bin/google-chrome-stable", 
-                "/usr/bin/chromium-browser",
-                "/usr/bin/chromium",
-                "/snap/bin/chromium",
-                "google-chrome",
-                "chromium-browser"
-            ],
-            "darwin": [  # macOS
-                "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-                "/Applications/Chromium.app/Contents/MacOS/Chromium",
-                "google-chrome",
-                "chromium"
-            ],
-            "windows": [
-                r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-                r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-                r"C:\Users\%USERNAME%\AppData\Local\Google\Chrome\Application\chrome.exe",
-                "chrome.exe",
-                "google-chrome"
-            ]
-        }
-        
-        paths_to_try = chrome_paths.get(system, chrome_paths["linux"])
-        
-        for path in paths_to_try:
-            try:
-                # Expand environment variables for Windows paths
-                expanded_path = os.path.expandvars(path)
-                
-                # Try using 'which' command first
-                if not os.path.isabs(expanded_path):
-                    result = subprocess.run(["which", path], capture_output=True, text=True)
-                    if result.returncode == 0:
-                        return result.stdout.strip()
-                
-                # Check if absolute path exists
-                if os.path.isfile(expanded_path):
-                    return expanded_path
-                    
-            except (subprocess.SubprocessError, OSError):
-                continue
-                
-        return None
+        return _find_chrome_executable()
     
     def is_remote_chrome_available(self) -> bool:
         """Check if Chrome remote debugging is already available."""
         try:
-            response = requests.get(f"http://localhost:{self.port}/json/version", timeout=2)
+            response = self._http.get(f"http://localhost:{self.port}/json/version", timeout=2)
             if response.status_code == 200:
                 version_info = response.json()
                 console.print(f"[dim]Using existing Chrome: {version_info.get('Browser', 'Unknown')}[/dim]")
@@ -102,22 +149,7 @@ class ChromeLauncher:
         # Chrome flags for reliable headless operation
         chrome_args = [
             chrome_path,
-            "--headless=new",
-            "--no-sandbox",
-            "--disable-gpu", 
-            "--disable-dev-shm-usage",
-            "--disable-extensions",
-            "--no-first-run",
-            "--disable-default-apps",
-            "--disable-background-timer-throttling",
-            "--disable-backgrounding-occluded-windows",
-            "--disable-renderer-backgrounding",
-            "--disable-features=TranslateUI",
-            "--disable-component-extensions-with-background-pages",
-            "--no-default-browser-check",
-            "--no-first-run",
-            "--disable-web-security",
-            "--allow-running-insecure-content",
+            *_CHROME_FLAGS,
             f"--remote-debugging-port={self.port}",
             f"--user-data-dir={self.user_data_dir}"
         ]
@@ -128,12 +160,22 @@ class ChromeLauncher:
                 chrome_args,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                preexec_fn=os.setsid if hasattr(os, 'setsid') else None
+                start_new_session=True
             )
             
-            # Wait for Chrome to start up with better timing and more attempts
-            for attempt in range(30):  # Increased attempts for CI environments
-                time.sleep(0.5)  # Longer sleep for stability
+            # Wait for Chrome to start up, returning as soon as it reports the DevTools port
+            # is open or a probe succeeds. Probes back off from 20ms up to 250ms, within
+            # the same overall 15s allowance as before for slow CI environments.
+            stderr_fd = self._nonblocking_stderr()
+            stderr_tail = b""
+            deadline = time.monotonic() + 15
+            delay = 0.02
+            while time.monotonic() < deadline:
+                if stderr_fd is not None:
+                    stderr_tail = self._read_available(stderr_fd, stderr_tail)
+                    if DEVTOOLS_READY_MARKER in stderr_tail:
+                        console.print(f"[green]Chrome launched on port {self.port}[/green]")
+                        return True
                 if self.is_remote_chrome_available():
                     console.print(f"[green]Chrome launched on port {self.port}[/green]")
                     return True
@@ -142,12 +184,17 @@ class ChromeLauncher:
                     console.print(f"[red]Chrome process died with exit code {self.process.returncode}[/red]")
                     # Try to read stderr for more info
                     try:
-                        _, stderr = self.process.communicate(timeout=1)
+                        if stderr_fd is not None:
+                            stderr = self._read_available(stderr_fd, stderr_tail)
+                        else:
+                            _, stderr = self.process.communicate(timeout=1)
                         if stderr:
                             console.print(f"[red]Chrome stderr: {stderr.decode()[:200]}[/red]")
                     except:
                         pass
                     break
+                time.sleep(delay)
+                delay = min(delay * 1.5, 0.25)
             
             console.print("[red]Chrome failed to start remote debugging[/red]")
             self.cleanup()
@@ -157,6 +204,29 @@ class ChromeLauncher:
             console.print(f"[red]Failed to launch Chrome: {e}[/red]")
             return False
     
+    def _nonblocking_stderr(self) -> Optional[int]:
+        """Get Chrome's stderr pipe in non-blocking mode, or None where that's unsupported."""
+        try:
+            fd = self.process.stderr.fileno()
+            os.set_blocking(fd, False)
+            return fd
+        except (AttributeError, OSError, ValueError):
+            # Pipes can't be made non-blocking on Windows, so rely on HTTP probes alone
+            return None
+    
+    def _read_available(self, fd: int, tail: bytes) -> bytes:
+        """Append whatever stderr output is available without waiting, keeping the last 4KB."""
+        try:
+            while chunk := os.read(fd, 65536):
+                tail = (tail + chunk)[-4096:]
+        except (BlockingIOError, OSError):
+            pass
+        return tail
+    
+    def is_running(self) -> bool:
+        """Check if the Chrome process this launcher started is still alive."""
+        return self.process is not None and self.process.poll() is None
+    
     def cleanup(self):
         """Clean up Chrome process and temporary files."""
         if self.process:
@@ -169,10 +239,13 @@ class ChromeLauncher:
                 except OSError:
                     pass
             self.process = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
     
     def _show_installation_help(self):
         """Show platform-specific Chrome installation instructions."""
-        system = platform.system().lower()
+        system = _SYSTEM
         
         if system == "linux":
             console.print("[yellow]Install Chrome on Linux:[/yellow]")
@@ -203,6 +276,50 @@ class ChromeLauncher:
         self.cleanup()
 
 
+class ChromePool:
+    """Several Chrome instances on separate debugging ports, for running audits in parallel."""
+    
+    def __init__(self, ports: List[int]):
+        self.launchers = [ChromeLauncher(port) for port in ports]
+        self._available = queue.Queue()
+    
+    def launch(self) -> bool:
+        """Launch every instance at once, returning True if at least one started."""
+        # Each launch mostly waits for DevTools to come up, so start them together
+        with ThreadPoolExecutor(max_workers=len(self.launchers)) as executor:
+            started = list(executor.map(lambda launcher: launcher.launch_chrome(), self.launchers))
+        
+        for launcher, ready in zip(self.launchers, started):
+            if ready:
+                self._available.put(launcher.port)
+        return any(started)
+    
+    @contextmanager
+    def port(self) -> Iterator[int]:
+        """Borrow an idle instance's debugging port for the duration of one audit."""
+        port = self._available.get()
+        try:
+            yield port
+        finally:
+            self._available.put(port)
+    
+    def cleanup(self):
+        """Shut down every instance the pool started."""
+        for launcher in self.launchers:
+            launcher.cleanup()
+    
+    def __enter__(self):
+        """Context manager entry."""
+        if self.launch():
+            return self
+        self.cleanup()
+        raise RuntimeError("Failed to launch Chrome")
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.cleanup()
+
+
 def get_chrome_connection() -> Tuple[bool, Optional[ChromeLauncher]]:
     """Get a Chrome connection, launching if needed."""
     launcher = ChromeLauncher()
@@ -215,4 +332,45 @@ def get_chrome_connection() -> Tuple[bool, Optional[ChromeLauncher]]:
     if launcher.launch_chrome():
         return True, launcher
     
-    return False, None
\ No newline at end of file
+    return False, None
+
+
+def prelaunch_shared_chrome():
+    """Start connecting to the shared Chrome in the background.
+    
+    Launching takes a few seconds, so callers can overlap it with their own setup;
+    get_shared_chrome() then waits for the launch rather than starting another.
+    """
+    global _prelaunch
+    if _prelaunch is None:
+        executor = ThreadPoolExecutor(max_workers=1)
+        _prelaunch = executor.submit(_connect_shared_chrome)
+        executor.shutdown(wait=False)
+
+
+def get_shared_chrome() -> Tuple[bool, Optional[ChromeLauncher]]:
+    """Get a Chrome connection that stays up for the rest of the process.
+    
+    Launching Chrome takes seconds, so a sweep over every framework reuses one
+    instance rather than probing or relaunching per framework.
+    """
+    global _prelaunch
+    if _prelaunch is not None:
+        prelaunch, _prelaunch = _prelaunch, None
+        chrome_ready, launcher = prelaunch.result()
+        if chrome_ready:
+            return chrome_ready, launcher
+    return _connect_shared_chrome()
+
+
+def _connect_shared_chrome() -> Tuple[bool, Optional[ChromeLauncher]]:
+    """Reuse the shared Chrome if it's still running, otherwise connect or launch one."""
+    global _shared_launcher
+    if _shared_launcher is not None and _shared_launcher.is_running():
+        return True, _shared_launcher
+    
+    chrome_ready, launcher = get_chrome_connection()
+    if launcher:
+        _shared_launcher = launcher
+        atexit.register(launcher.cleanup)
+    return chrome_ready, launcher
@@ -4,6 +4,10 @@
 import json
 import os
 import re
+import select
+import shutil
+import signal
+import socket
 import subprocess
 import tempfile
 import time
@@ -11,12 +15,61 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import requests
-from rich.console import Console
 from rich.table import Table
 
 from base import BenchmarkRunner, BenchmarkResult
+from common import console
 
-console = Console()
+try:
+    from websockets.sync.client import connect as ws_connect
+except ImportError:  # The sync client needs websockets 11+, fall back to HTTP timing
+    ws_connect = None
+
+
+# Ways a dev command can specify its port, in order of precedence
+PORT_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'--port[= ](\d+)',
+    r'-p[= ](\d+)',
+    r':\s*(\d+)',
+    r'(\d+)$'  # Port at end of command
+))
+
+# How much of a page to read when checking which server is answering on a port
+RESPONSE_SNIFF_BYTES = 2048
+
+# Markers that a page is served by a development app rather than something else
+DEV_APP_PATTERN = re.compile(rb"weather|vite|<!doctype html|webpack|hmr|hot")
+
+# Lines dev servers print once they're serving (Vite, then Angular and webpack-dev-server)
+DEV_READY_PATTERN = re.compile(rb"ready in|compiled successfully|local:\s+https?://", re.IGNORECASE)
+
+# HMR WebSocket paths to try per framework; Vite serves HMR on the dev server root
+DEFAULT_HMR_SOCKET_PATHS = ("/", "/ws")
+HMR_SOCKET_PATHS = {
+    "angular": ("/", "/ng-cli-ws"),
+}
+
+# Source extensions worth editing for an HMR test, in order of preference
+HMR_SOURCE_EXTENSIONS = (".js", ".jsx", ".ts", ".tsx", ".vue", ".svelte")
+
+# Directories under a source tree that never hold an app's own source
+HMR_SKIP_DIRS = frozenset({"node_modules", "dist", "build"})
+
+# Largest file the HMR test will edit, keeping rebuilds representative
+HMR_MAX_FILE_SIZE = 10000
+
+# HMR message types sent once a change has been processed (Vite, then webpack-dev-server)
+HMR_UPDATE_TYPES = frozenset({"update", "full-reload", "ok", "still-ok"})
+
+
+def _read_available(fd: int, tail: bytes) -> bytes:
+    """Append whatever output a non-blocking pipe has ready, keeping the last 4KB."""
+    try:
+        while chunk := os.read(fd, 65536):
+            tail = (tail + chunk)[-4096:]
+    except (BlockingIOError, OSError):
+        pass
+    return tail
 
 
 class DevServerRunner(BenchmarkRunner):
@@ -26,59 +79,41 @@ class DevServerRunner(BenchmarkRunner):
     def benchmark_name(self) -> str:
         return "Dev Server"
     
-    def __init__(self):
+    def __init__(self, concurrency: int = 1, warm_cache: bool = False):
         super().__init__()
-        self.frameworks_config = self._load_frameworks_config()
+        # Every framework gets its own port and app dir, so servers can run side by side, but
+        # concurrent startups compete for CPU and skew timings, so default to one at a time
+        self.parallelism = max(1, concurrency)
+        # Fallback ports for frameworks without a fixed one, unique so concurrent runs don't clash
+        self._fallback_ports = {fw["id"]: 5190 + i for i, fw in enumerate(self.frameworks)}
+        # Source file each framework's HMR test edits, found once and reused across runs
+        self._hmr_target_cache: Dict[str, Optional[Path]] = {}
+        # Start each server once untimed first, so bundler caches (Vite's optimized deps,
+        # Angular's build cache) are populated and startup reflects day-to-day development
+        self.warm_cache = warm_cache
+        self._warmed = set()
     
     def check_server_health(self) -> bool:
         """Dev server measurement doesn't require the main benchmark server."""
         return True
     
-    def _load_frameworks_config(self) -> Dict:
-        """Load frameworks configuration."""
-        config_path = Path(__file__).parent.parent.parent / "frameworks.json"
-        try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            console.print(f"[red]Failed to load frameworks.json: {e}[/red]")
-            return {"frameworks": []}
-    
     def _get_framework_config(self, framework_id: str) -> Optional[Dict]:
         """Get configuration for a specific framework."""
-        for fw in self.frameworks_config.get("frameworks", []):
-            if fw["id"] == framework_id:
-                return fw
-        return None
+        return self._frameworks_by_id.get(framework_id)
     
     def _find_framework_dir(self, framework_config: Dict) -> Optional[Path]:
         """Find the framework directory."""
-        script_dir = Path(__file__).parent
-        project_root = script_dir.parent.parent  # Go up from scripts/benchmark/ to project root
-        
-        for possible_path in [
-            project_root / "apps",    # From project root
-            Path("../../apps"),       # Relative from scripts/benchmark/
-            Path("apps"),             # From current working directory
-            Path("./apps")            # Alternative current directory
-        ]:
-            if possible_path.exists():
-                framework_dir = possible_path / framework_config["dir"]
-                if framework_dir.exists():
-                    return framework_dir.resolve()  # Get absolute path
+        apps_dir = self._get_apps_dir()
+        if apps_dir:
+            framework_dir = apps_dir / framework_config["dir"]
+            if framework_dir.exists():
+                return framework_dir
         return None
     
     def _extract_port_from_command(self, dev_command: str) -> int:
         """Extract port number from dev command, use framework-specific defaults."""
-        port_patterns = [
-            r'--port[= ](\d+)',
-            r'-p[= ](\d+)', 
-            r':\s*(\d+)',
-            r'(\d+)$'  # Port at end of command
-        ]
-        
-        for pattern in port_patterns:
-            match = re.search(pattern, dev_command)
+        for pattern in PORT_PATTERNS:
+            match = pattern.search(dev_command)
             if match:
                 return int(match.group(1))
         
@@ -104,8 +139,9 @@ class DevServerRunner(BenchmarkRunner):
             # Force these frameworks to use non-conflicting ports
             ports_to_try = [3030, 3031, 8000, 8080]
         
-        # Wait a brief moment for the process to start
-        time.sleep(1.0)  # Increased wait time
+        # Drain the server's output as we poll, so a chatty server can't block on a full pipe
+        output_fds = self._nonblocking_output(process)
+        output_tails = dict.fromkeys(output_fds, b"")
         
         for try_port in ports_to_try:
             url = f"http://localhost:{try_port}"
@@ -114,71 +150,115 @@ class DevServerRunner(BenchmarkRunner):
             if process.poll() is not None:
                 # Process died, check output
                 try:
-                    stdout, stderr = process.communicate(timeout=1)
+                    stdout, stderr = self._exited_output(process, output_fds, output_tails)
                     error_details = ""
                     if stderr:
-                        error_details += f"stderr: {stderr[:200]}"
+                        error_details += f"stderr: {stderr[-200:]}"
                     if stdout:
-                        error_details += f"stdout: {stdout[:200]}"
+                        error_details += f"stdout: {stdout[-200:]}"
                     raise TimeoutError(f"Dev server process exited. {error_details}")
                 except subprocess.TimeoutExpired:
                     raise TimeoutError("Dev server process exited unexpectedly")
             
-            # Try to connect to this port
+            # Try to connect to this port, probing quickly at first and backing off to 100ms.
+            # Between probes, wake early on server output, and once the server says it's
+            # ready go back to probing quickly
             elapsed = 0
+            delay = 0.01
+            announced_ready = False
             while elapsed < timeout:
                 try:
-                    response = requests.get(url, timeout=2)
-                    if response.status_code == 200:
+                    # A refused TCP connect is a cheap "not yet", so only make the HTTP request
+                    # once the port is open; the request reuses a keep-alive session
+                    with socket.create_connection(("localhost", try_port), timeout=0.1):
+                        pass
+                    # Only the start of the page is needed to recognise it, so don't download it all
+                    with self._http.get(url, timeout=2, stream=True) as response:
+                        status_code = response.status_code
+                        content = response.raw.read(RESPONSE_SNIFF_BYTES, decode_content=True).lower()
+                    if status_code == 200:
                         # Check if this is actually our dev server by looking at response
-                        content = response.text.lower()
-                        
                         # Skip if this looks like the main benchmark server
-                        if "benchmark" in content and "frameworks" in content:
+                        if b"benchmark" in content and b"frameworks" in content:
                             console.print(f"[dim]⚠️  Port {try_port} has main benchmark server, skipping[/dim]")
                             continue
                             
                         # Accept if it looks like a development app
-                        if any(keyword in content for keyword in ["weather", "vite", "<!doctype html", "webpack", "hmr", "hot"]):
+                        if DEV_APP_PATTERN.search(content):
                             total_time = time.time() - start_time
                             console.print(f"[dim]✅ Dev server ready on port {try_port} in {total_time:.2f}s[/dim]")
                             return total_time, try_port
-                except requests.RequestException:
+                except (OSError, requests.RequestException):
                     pass
                 
-                time.sleep(0.2)
+                delay = min(delay * 2, 0.1)
+                if self._wait_for_output(output_fds, output_tails, delay) and not announced_ready:
+                    announced_ready = True
+                    delay = 0.01
                 elapsed = time.time() - start_time
                 
                 # Check if process died during startup
                 if process.poll() is not None:
                     try:
-                        stdout, stderr = process.communicate(timeout=1)
+                        stdout, stderr = self._exited_output(process, output_fds, output_tails)
                         error_details = ""
                         if stderr:
-                            error_details += f" stderr: {stderr[:200]}"
+                            error_details += f" stderr: {stderr[-200:]}"
                         raise TimeoutError(f"Dev server process exited during startup.{error_details}")
                     except subprocess.TimeoutExpired:
                         raise TimeoutError("Dev server process exited during startup")
         
         raise TimeoutError(f"Dev server did not become ready on any port within {timeout}s")
     
-    def _measure_hmr_speed(self, framework_dir: Path, port: int) -> Tuple[float, float]:
+    def _wait_for_output(self, output_fds: Dict[str, int], output_tails: Dict[str, bytes], timeout: float) -> bool:
+        """Wait up to timeout for server output and drain it, returning True once it has announced it's ready."""
+        if not output_fds:
+            time.sleep(timeout)
+            return False
+        
+        readable, _, _ = select.select(list(output_fds.values()), [], [], timeout)
+        received = False
+        for name, fd in output_fds.items():
+            tail = output_tails[name]
+            output_tails[name] = _read_available(fd, tail)
+            received = received or output_tails[name] != tail
+        if readable and not received:
+            # Closed pipes stay readable, so don't let them turn this into a busy loop
+            time.sleep(timeout)
+        return any(DEV_READY_PATTERN.search(tail) for tail in output_tails.values())
+    
+    def _nonblocking_output(self, process: subprocess.Popen) -> Dict[str, int]:
+        """Switch the server's output pipes to non-blocking, or return {} where unsupported."""
+        output_fds = {}
+        try:
+            for name in ("stdout", "stderr"):
+                fd = getattr(process, name).fileno()
+                os.set_blocking(fd, False)
+                output_fds[name] = fd
+        except (AttributeError, OSError, ValueError):
+            # Pipes can't be made non-blocking on Windows, so collect output on exit instead
+            return {}
+        return output_fds
+    
+    def _exited_output(self, process: subprocess.Popen, output_fds: Dict[str, int], output_tails: Dict[str, bytes]) -> Tuple[str, str]:
+        """Get the tail of an exited server's stdout and stderr."""
+        if not output_fds:
+            return process.communicate(timeout=1)
+        
+        # The process has exited, so one last non-blocking read drains what's left
+        stdout = _read_available(output_fds["stdout"], output_tails["stdout"])
+        stderr = _read_available(output_fds["stderr"], output_tails["stderr"])
+        return stdout.decode(errors="replace"), stderr.decode(errors="replace")
+    
+    def _measure_hmr_speed(self, framework: str, framework_dir: Path, port: int) -> Tuple[float, float]:
         """Measure HMR speed by modifying a source file and timing the response."""
         # Find a source file to modify
-        src_patterns = ["src/**/*.js", "src/**/*.jsx", "src/**/*.ts", "src/**/*.tsx", 
-                       "src/**/*.vue", "src/**/*.svelte", "js/**/*.js"]
-        
-        target_file = None
-        for pattern in src_patterns:
-            files = list(framework_dir.glob(pattern))
-            if files:
-                # Pick first file that exists and is not too large
-                for file in files:
-                    if file.is_file() and file.stat().st_size < 10000:  # < 10KB
-                        target_file = file
-                        break
-                if target_file:
-                    break
+        if framework not in self._hmr_target_cache:
+            self._hmr_target_cache[framework] = (
+                self._find_hmr_target(framework_dir / "src", HMR_SOURCE_EXTENSIONS)
+                or self._find_hmr_target(framework_dir / "js", (".js",))
+            )
+        target_file = self._hmr_target_cache[framework]
         
         if not target_file:
             console.print(f"[yellow]No suitable source file found for HMR test in {framework_dir}[/yellow]")
@@ -186,54 +266,56 @@ class DevServerRunner(BenchmarkRunner):
         
         # Read original content
         try:
-            original_content = target_file.read_text()
+            original_content = target_file.read_bytes()
         except Exception as e:
             console.print(f"[yellow]Failed to read {target_file}: {e}[/yellow]")
             return 0.0, 0.0
         
+        # Listen for the dev server's own HMR messages where possible, rather than
+        # inferring HMR completion from an unrelated HTTP round-trip
+        hmr_socket = self._open_hmr_socket(framework, port)
+        if hmr_socket is not None:
+            # Vite only pushes updates for modules in its graph, so request the file once
+            try:
+                self._http.get(f"http://localhost:{port}/{target_file.relative_to(framework_dir).as_posix()}", timeout=3)
+            except requests.RequestException:
+                pass
+        
         # Measure file change detection
         hmr_times = []
-        for i in range(3):  # Test HMR 3 times for average
-            try:
-                # Add a comment to trigger HMR
-                modified_content = original_content + f"\n// HMR test {i + 1} - {time.time()}"
-                
-                # Measure time to detect file change (file system -> HMR trigger)
-                file_change_start = time.time()
-                target_file.write_text(modified_content)
-                
-                # Wait a bit for file system events to propagate
-                time.sleep(0.1)
-                
-                # Measure time for HMR to complete (basic estimation via HTTP check)
-                hmr_start = time.time()
-                
-                # Check server response time as proxy for HMR completion
-                url = f"http://localhost:{port}"
+        try:
+            for i in range(3):  # Test HMR 3 times for average
                 try:
-                    response = requests.get(url, timeout=3)
-                    if response.status_code == 200:
-                        hmr_end = time.time()
-                        
-                        file_detection_time = hmr_start - file_change_start
-                        hmr_response_time = hmr_end - hmr_start
-                        total_hmr_time = hmr_end - file_change_start
-                        
-                        hmr_times.append(total_hmr_time)
-                        console.print(f"[dim]🔥 HMR test {i+1}: {total_hmr_time*1000:.0f}ms[/dim]")
-                        
-                except requests.RequestException:
-                    console.print(f"[yellow]HMR test {i+1} failed - server not responsive[/yellow]")
-                
-                # Brief pause between tests
-                time.sleep(0.5)
-                
-            except Exception as e:
-                console.print(f"[yellow]HMR test {i+1} failed: {e}[/yellow]")
+                    # Add a comment to trigger HMR
+                    modified_content = original_content + f"\n// HMR test {i + 1} - {time.time()}".encode()
+                    
+                    if hmr_socket is not None:
+                        # Time from the file write to the server announcing the update, ignoring
+                        # any messages left over from the previous change
+                        self._drain_hmr_socket(hmr_socket)
+                        file_change_start = time.perf_counter()
+                        self._replace_file(target_file, modified_content)
+                        if self._wait_for_hmr_update(hmr_socket, timeout=5):
+                            total_hmr_time = time.perf_counter() - file_change_start
+                            hmr_times.append(total_hmr_time)
+                            console.print(f"[dim]🔥 HMR test {i+1}: {total_hmr_time*1000:.0f}ms[/dim]")
+                        else:
+                            console.print(f"[yellow]HMR test {i+1} failed - no HMR update received[/yellow]")
+                    else:
+                        self._measure_hmr_over_http(target_file, modified_content, port, i, hmr_times)
+                    
+                    # The previous update has landed, so only let the filesystem settle
+                    time.sleep(0.05)
+                    
+                except Exception as e:
+                    console.print(f"[yellow]HMR test {i+1} failed: {e}[/yellow]")
+        finally:
+            if hmr_socket is not None:
+                hmr_socket.close()
         
         # Restore original content
         try:
-            target_file.write_text(original_content)
+            self._replace_file(target_file, original_content)
         except Exception as e:
             console.print(f"[yellow]Failed to restore {target_file}: {e}[/yellow]")
         
@@ -244,6 +326,100 @@ class DevServerRunner(BenchmarkRunner):
         
         return 0.0, 0.0
     
+    def _find_hmr_target(self, source_dir: Path, extensions: Tuple[str, ...]) -> Optional[Path]:
+        """Find a small source file to edit, preferring extensions listed earlier."""
+        # One walk of the tree, keeping the first match per extension and
+        # stopping early once the most preferred kind turns up
+        best_rank, best_path = len(extensions), None
+        for root, dirs, files in os.walk(source_dir):
+            dirs[:] = [d for d in dirs if d not in HMR_SKIP_DIRS and not d.startswith(".")]
+            for name in files:
+                rank = next((i for i, ext in enumerate(extensions) if name.endswith(ext)), None)
+                if rank is None or rank >= best_rank:
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    if os.path.getsize(path) >= HMR_MAX_FILE_SIZE:
+                        continue
+                except OSError:
+                    continue
+                best_rank, best_path = rank, Path(path)
+                if rank == 0:
+                    return best_path
+        return best_path
+    
+    def _replace_file(self, path: Path, content: bytes):
+        """Swap in new file content with an atomic rename, so watchers see one complete change."""
+        # Writing in place truncates first, which some watchers report as a separate change
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False) as tmp:
+            tmp.write(content)
+        try:
+            shutil.copymode(path, tmp.name)
+            os.replace(tmp.name, path)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
+    
+    def _open_hmr_socket(self, framework: str, port: int):
+        """Connect to the dev server's HMR WebSocket, or return None if unavailable."""
+        if ws_connect is None:
+            return None
+        
+        for path in HMR_SOCKET_PATHS.get(framework, DEFAULT_HMR_SOCKET_PATHS):
+            try:
+                return ws_connect(f"ws://localhost:{port}{path}", subprotocols=["vite-hmr"], open_timeout=2)
+            except Exception:
+                continue
+        return None
+    
+    def _drain_hmr_socket(self, hmr_socket):
+        """Discard any HMR messages already received."""
+        try:
+            while True:
+                hmr_socket.recv(timeout=0)
+        except TimeoutError:
+            pass
+    
+    def _wait_for_hmr_update(self, hmr_socket, timeout: float) -> bool:
+        """Wait for an HMR message announcing the change was applied."""
+        deadline = time.perf_counter() + timeout
+        while (remaining := deadline - time.perf_counter()) > 0:
+            try:
+                message = hmr_socket.recv(timeout=remaining)
+            except TimeoutError:
+                return False
+            try:
+                if json.loads(message).get("type") in HMR_UPDATE_TYPES:
+                    return True
+            except (ValueError, AttributeError):
+                continue
+        return False
+    
+    def _measure_hmr_over_http(self, target_file: Path, modified_content: bytes, port: int, i: int, hmr_times: List[float]):
+        """Estimate HMR time from a page request after the change, when no HMR socket is available."""
+        # Measure time to detect file change (file system -> HMR trigger)
+        file_change_start = time.time()
+        self._replace_file(target_file, modified_content)
+        
+        # Wait a bit for file system events to propagate
+        time.sleep(0.1)
+        
+        # Check server response time as proxy for HMR completion. Timed from the write, so
+        # the result includes the 100ms settle above and is a coarse upper bound
+        url = f"http://localhost:{port}"
+        try:
+            response = self._http.get(url, timeout=3)
+            if response.status_code == 200:
+                hmr_end = time.time()
+                
+                total_hmr_time = hmr_end - file_change_start
+                
+                hmr_times.append(total_hmr_time)
+                console.print(f"[dim]🔥 HMR test {i+1}: {total_hmr_time*1000:.0f}ms[/dim]")
+                
+        except requests.RequestException:
+            console.print(f"[yellow]HMR test {i+1} failed - server not responsive[/yellow]")
+    
     def run_single_benchmark(self, framework: str) -> BenchmarkResult:
         """Measure dev server startup and HMR speed for a single framework."""
         try:
@@ -275,7 +451,7 @@ class DevServerRunner(BenchmarkRunner):
                     "vanjs": 5181,      # Vite + 8
                 }
                 
-                assigned_port = framework_ports.get(framework, 5190)
+                assigned_port = framework_ports.get(framework) or self._fallback_ports.get(framework, 5190)
                 
                 # Always replace port 3000 to avoid main server conflicts
                 if original_port == 3000 or original_port == 3001:
@@ -318,16 +494,13 @@ class DevServerRunner(BenchmarkRunner):
             console.print(f"[dim]🚀 {framework}: Starting dev server with command: {dev_command}[/dim]")
             console.print(f"[dim]🚀 {framework}: Expected port: {port}[/dim]")
             
+            args, needs_shell = self._prepare_command(dev_command)
+            if self.warm_cache and framework not in self._warmed:
+                self._warm_dev_server(framework, args, needs_shell, framework_dir, port)
+            
             # Start dev server
             console.print(f"[dim]🔧 {framework}: Running command: {dev_command}[/dim]")
-            process = subprocess.Popen(
-                dev_command,
-                shell=True,
-                cwd=framework_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            process = self._start_dev_server(args, needs_shell, framework_dir)
             
             try:
                 # Measure startup time
@@ -339,7 +512,7 @@ class DevServerRunner(BenchmarkRunner):
                 
                 # Measure HMR speed
                 console.print(f"[dim]🔥 {framework}: Testing HMR speed...[/dim]")
-                hmr_avg, hmr_min = self._measure_hmr_speed(framework_dir, actual_port)
+                hmr_avg, hmr_min = self._measure_hmr_speed(framework, framework_dir, actual_port)
                 
                 return BenchmarkResult(framework, self.benchmark_name, {
                     "framework": framework,
@@ -354,16 +527,7 @@ class DevServerRunner(BenchmarkRunner):
                 
             finally:
                 # Always cleanup the dev server
-                try:
-                    process.terminate()
-                    process.wait(timeout=5)
-                    console.print(f"[dim]🛑 {framework}: Dev server stopped[/dim]")
-                except Exception:
-                    try:
-                        process.kill()
-                        process.wait(timeout=2)
-                    except Exception:
-                        pass
+                self._stop_dev_server(framework, process)
                 
         except subprocess.TimeoutExpired:
             return self._create_error_result(framework, "Dev server startup timed out")
@@ -382,6 +546,56 @@ class DevServerRunner(BenchmarkRunner):
         except Exception as e:
             return self._create_error_result(framework, f"Dev server measurement failed: {str(e)}")
     
+    def _start_dev_server(self, args, needs_shell: bool, framework_dir: Path) -> subprocess.Popen:
+        """Start a dev server in its own process group."""
+        return subprocess.Popen(
+            args,
+            shell=needs_shell,
+            # Own process group, so stopping the server also stops workers it spawned (e.g. esbuild)
+            start_new_session=True,
+            cwd=framework_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+    
+    def _stop_dev_server(self, framework: str, process: subprocess.Popen):
+        """Stop a dev server and everything it started."""
+        try:
+            self._signal_process_group(process, signal.SIGTERM)
+            process.wait(timeout=5)
+            console.print(f"[dim]🛑 {framework}: Dev server stopped[/dim]")
+        except Exception:
+            try:
+                self._signal_process_group(process, getattr(signal, "SIGKILL", signal.SIGTERM))
+                process.wait(timeout=2)
+            except Exception:
+                pass
+    
+    def _warm_dev_server(self, framework: str, args, needs_shell: bool, framework_dir: Path, port: int):
+        """Start and stop a dev server once, untimed, to populate its caches."""
+        console.print(f"[dim]♨️  {framework}: Warming dev server cache...[/dim]")
+        process = self._start_dev_server(args, needs_shell, framework_dir)
+        try:
+            # A cold first start can take a while, so allow longer than the timed run
+            self._wait_for_server_ready(port, process, timeout=60)
+        except TimeoutError as e:
+            console.print(f"[yellow]Warning: Cache warm-up for {framework} failed: {e}[/yellow]")
+        finally:
+            self._stop_dev_server(framework, process)
+        self._warmed.add(framework)
+    
+    def _signal_process_group(self, process: subprocess.Popen, sig: int):
+        """Send a signal to the dev server's whole process group, or just the process on Windows."""
+        if hasattr(os, "killpg"):
+            # start_new_session made the server a group leader, so its pid is the group id
+            try:
+                os.killpg(process.pid, sig)
+            except ProcessLookupError:
+                pass
+        else:
+            process.send_signal(sig)
+    
     def _create_error_result(self, framework: str, error: str) -> BenchmarkResult:
         """Create a failed benchmark result."""
         result = BenchmarkResult(framework, self.benchmark_name, {
@@ -3,47 +3,113 @@
 
 import json
 import subprocess
-import tempfile
-from pathlib import Path
-from typing import Any, Dict, List
+import threading
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional
 
 import click
-from rich.console import Console
 from rich.table import Table
 
 from base import BenchmarkRunner, BenchmarkResult
-from chrome_launcher import get_chrome_connection
+from common import console
+from chrome_launcher import DEFAULT_DEBUG_PORT, ChromePool, get_shared_chrome, prelaunch_shared_chrome
 
-console = Console()
+try:
+    from websockets.sync.client import connect as ws_connect
+except ImportError:  # The sync client needs websockets 11+, skip clearing the cache
+    ws_connect = None
+
+
+# Audits reported for each framework, in display order
+KEY_METRICS = ("first-contentful-paint", "largest-contentful-paint",
+               "speed-index", "cumulative-layout-shift", "total-blocking-time")
+
+# Unscored audits whose base64 screenshots and treemaps make up much of a report
+SKIPPED_AUDITS = ("screenshot-thumbnails", "final-screenshot", "script-treemap-data")
+
+# Score columns in the summary table, with the threshold used when config has none
+SUMMARY_CATEGORIES = (("performance", 80), ("accessibility", 90), ("best-practices", 80), ("seo", 90))
+
+# Reads all of an audit's fields in one call, when it has every one of them
+_get_metric_fields = itemgetter("numericValue", "displayValue", "score")
 
 
 class LighthouseRunner(BenchmarkRunner):
     """Lighthouse benchmark runner."""
     
+    requires_serial = True
+    
+    # Column headers and options for the detailed results tables
+    _SCORE_COLUMNS = (
+        ("Category", {"style": "bold"}),
+        ("Score", {"justify": "right"}),
+        ("Status", {"justify": "center"}),
+    )
+    _METRIC_COLUMNS = (
+        ("Metric", {"style": "bold"}),
+        ("Value", {"justify": "right"}),
+        ("Score", {"justify": "center"}),
+    )
+    
     @property
     def benchmark_name(self) -> str:
         return "Lighthouse"
     
-    def __init__(self):
+    def __init__(self, concurrency: Optional[int] = None):
         super().__init__()
         self.lighthouse_config = self.benchmark_config.get("lighthouse", {})
         self.thresholds = self.lighthouse_config.get("thresholds", {})
         self.categories = self.lighthouse_config.get("categories", ["performance"])
+        # Green and yellow cut-offs per summary column, scores below both show red
+        self._score_bands = []
+        for category, default in SUMMARY_CATEGORIES:
+            threshold = self.thresholds.get(category, default)
+            self._score_bands.append((category, threshold, threshold - 10))
         self.chrome_launcher = None
+        # DevTools connections used to clear the cache, one per Chrome debugging port
+        self._devtools_sockets = {}
+        
+        # Audits share one Chrome unless configured to run several, each with its own Chrome
+        if concurrency is None:
+            concurrency = self.lighthouse_config.get("concurrency", 1)
+        self.concurrency = max(1, int(concurrency))
+        self.chrome_pool = None
+        self._chrome_pool_lock = threading.Lock()
+        if self.concurrency > 1:
+            self.requires_serial = False
+            self.parallelism = self.concurrency
+    
+    def run_all_frameworks(self, frameworks: Optional[List[str]] = None, executions: int = 1,
+                           on_start: Optional[Callable[[str], None]] = None,
+                           on_result: Optional[Callable[[BenchmarkResult], None]] = None) -> List[BenchmarkResult]:
+        """Run audits for all frameworks, starting the shared Chrome alongside the server check."""
+        if self.concurrency == 1:
+            # Only launched once audits are due, so its startup overlaps with the health check
+            prelaunch_shared_chrome()
+        return super().run_all_frameworks(frameworks, executions, on_start, on_result)
     
     def run_single_benchmark(self, framework: str) -> BenchmarkResult:
         """Run Lighthouse audit for a single framework."""
         url = self.get_framework_url(framework)
         
+        if self.concurrency > 1:
+            if not self._ensure_chrome_pool():
+                return self._create_error_result(framework, "Chrome not available - install Chrome to run Lighthouse benchmarks")
+            with self.chrome_pool.port() as port:
+                return self._audit_with_chrome(framework, url, port)
+        
         # Ensure Chrome is available
         if not self._ensure_chrome_ready():
             return self._create_error_result(framework, "Chrome not available - install Chrome to run Lighthouse benchmarks")
-        
+        return self._audit_with_chrome(framework, url, DEFAULT_DEBUG_PORT)
+    
+    def _audit_with_chrome(self, framework: str, url: str, port: int) -> BenchmarkResult:
+        """Audit a framework using the Chrome on the given debugging port."""
         # Clear browser cache to ensure fresh results for each framework
-        self._clear_browser_cache()
+        self._clear_browser_cache(port)
         
         try:
-            return self._run_lighthouse_audit(framework, url)
+            return self._run_lighthouse_audit(framework, url, port)
         except subprocess.TimeoutExpired:
             return self._create_error_result(framework, "Lighthouse audit timed out")
         except Exception as e:
@@ -51,33 +117,44 @@ class LighthouseRunner(BenchmarkRunner):
     
     def _ensure_chrome_ready(self) -> bool:
         """Ensure Chrome is available for Lighthouse."""
-        chrome_ready, launcher = get_chrome_connection()
+        chrome_ready, launcher = get_shared_chrome()
         if chrome_ready:
-            self.chrome_launcher = launcher  # Store launcher for cleanup
+            if launcher:
+                self.chrome_launcher = launcher  # Store launcher for cleanup
             return True
         
         console.print("[red]Chrome not available for Lighthouse benchmarks[/red]")
         return False
     
-    def _run_lighthouse_audit(self, framework: str, url: str) -> BenchmarkResult:
+    def _ensure_chrome_pool(self) -> bool:
+        """Ensure one Chrome per concurrent audit is running."""
+        with self._chrome_pool_lock:
+            if self.chrome_pool is None:
+                pool = ChromePool([DEFAULT_DEBUG_PORT + i for i in range(self.concurrency)])
+                if not pool.launch():
+                    pool.cleanup()
+                    console.print("[red]Chrome not available for Lighthouse benchmarks[/red]")
+                    return False
+                self.chrome_pool = pool
+            return True
+    
+    def _run_lighthouse_audit(self, framework: str, url: str, port: int) -> BenchmarkResult:
         """Execute Lighthouse audit and parse results."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp_file:
-            tmp_path = tmp_file.name
-        
-        # Add cache-busting parameter to URL to ensure fresh results
-        import time
-        cache_bust_url = f"{url}&_cb={int(time.time() * 1000)}"
-        
-        # Build Lighthouse command with cache-busting flags
+        # Build Lighthouse command; the cache was cleared over DevTools beforehand.
+        # The report comes back on stdout, so it never goes through a temp file
         cmd = [
-            "npx", "lighthouse", cache_bust_url,
+            "npx", "lighthouse", url,
             "--output", "json", 
-            "--output-path", tmp_path,
+            "--output-path", "stdout",
             "--quiet",
-            "--port", "9222",
-            "--throttling-method", "simulate",  # Consistent throttling
+            "--port", str(port),
+            # Throttling is left at Lighthouse's default, simulated
             "--emulated-form-factor", "desktop",  # Consistent form factor
-            "--chrome-flags", "--disable-background-timer-throttling --disable-backgrounding-occluded-windows --disable-extensions"
+            # No --chrome-flags: Lighthouse attaches to the running Chrome on --port and only
+            # applies those when launching its own, so they're set in chrome_launcher instead.
+            # Leave out what results never read, so reports are smaller to write and parse
+            "--disable-full-page-screenshot",
+            "--skip-audits", ",".join(SKIPPED_AUDITS)
         ]
         
         # Add categories
@@ -86,21 +163,17 @@ class LighthouseRunner(BenchmarkRunner):
         
         # Run audit
         console.print(f"[dim]Auditing {framework}...[/dim]")
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=90)
+        # Keep the report as bytes, which json.loads takes without decoding it first
+        result = subprocess.run(cmd, capture_output=True, timeout=90)
         
-        try:
-            if result.returncode != 0:
-                error = result.stderr.strip() or result.stdout.strip() or "Unknown error"
-                return self._create_error_result(framework, error)
-            
-            # Parse and extract data
-            with open(tmp_path, 'r') as f:
-                data = json.load(f)
-            
-            return self._extract_lighthouse_data(framework, url, data)
-            
-        finally:
-            Path(tmp_path).unlink(missing_ok=True)
+        if result.returncode != 0:
+            error = (result.stderr.strip() or result.stdout.strip()).decode(errors="replace") or "Unknown error"
+            return self._create_error_result(framework, error)
+        
+        # Parse and extract data
+        data = json.loads(result.stdout)
+        
+        return self._extract_lighthouse_data(framework, url, data)
     
     def _extract_lighthouse_data(self, framework: str, url: str, data: Dict) -> BenchmarkResult:
         """Extract relevant data from Lighthouse results."""
@@ -110,19 +183,17 @@ class LighthouseRunner(BenchmarkRunner):
             if category.get("score") is not None:
                 scores[name] = round(category["score"] * 100, 1)
         
-        # Extract key metrics
+        # Extract key metrics, in KEY_METRICS order
         metrics = {}
-        key_metrics = ["first-contentful-paint", "largest-contentful-paint", 
-                      "speed-index", "cumulative-layout-shift", "total-blocking-time"]
-        
-        for metric_id in key_metrics:
-            if metric_id in data.get("audits", {}):
-                audit = data["audits"][metric_id]
-                metrics[metric_id] = {
-                    "value": audit.get("numericValue"),
-                    "displayValue": audit.get("displayValue", ""),
-                    "score": audit.get("score")
-                }
+        audits = data.get("audits") or {}
+        for metric_id in KEY_METRICS:
+            if (audit := audits.get(metric_id)) is None:
+                continue
+            try:
+                value, display_value, score = _get_metric_fields(audit)
+            except KeyError:
+                value, display_value, score = audit.get("numericValue"), audit.get("displayValue", ""), audit.get("score")
+            metrics[metric_id] = {"value": value, "displayValue": display_value, "score": score}
         
         return BenchmarkResult(framework, self.benchmark_name, {
             "url": url,
@@ -139,57 +210,69 @@ class LighthouseRunner(BenchmarkRunner):
         return result
     
     
-    def _clear_browser_cache(self):
-        """Clear browser cache between runs for accuracy."""
-        try:
-            import requests
-            
-            # Get list of open tabs
-            tabs_response = requests.get("http://127.0.0.1:9222/json", timeout=5)
-            if tabs_response.status_code != 200:
+    def _clear_browser_cache(self, port: int):
+        """Clear the cache of the Chrome on port, so every audit starts cold."""
+        origin = self.server_config.get("baseUrl", "http://127.0.0.1:3000")
+        devtools_commands = [
+            ("Network.clearBrowserCache", {}),
+            ("Network.clearBrowserCookies", {}),
+            ("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"}),
+        ]
+        
+        # A socket may have gone stale since the last run, so reconnect once on failure
+        for _ in range(2):
+            devtools = self._devtools_socket(port)
+            if devtools is None:
                 return
-            
-            tabs = tabs_response.json()
-            if not tabs:
+            try:
+                for command_id, (method, params) in enumerate(devtools_commands, 1):
+                    devtools.send(json.dumps({"id": command_id, "method": method, "params": params}))
+                    # Wait for this command's response, skipping any events
+                    while json.loads(devtools.recv(timeout=5)).get("id") != command_id:
+                        pass
                 return
-            
-            # Use the first available tab
-            tab = tabs[0]
-            ws_url = tab.get('webSocketDebuggerUrl')
+            except Exception:
+                # Cache clearing is optional - don't fail if it doesn't work
+                self._close_devtools_socket(port)
+    
+    def _devtools_socket(self, port: int):
+        """Get a DevTools WebSocket for the Chrome on this port, connecting on first use."""
+        if port in self._devtools_sockets:
+            return self._devtools_sockets[port]
+        if ws_connect is None:
+            return None
+        
+        try:
+            # Attach to a page target, which accepts the Network and Storage commands
+            tabs = self._http.get(f"http://127.0.0.1:{port}/json", timeout=5).json()
+            ws_url = next((tab["webSocketDebuggerUrl"] for tab in tabs
+                           if tab.get("type") == "page" and tab.get("webSocketDebuggerUrl")), None)
             if not ws_url:
-                return
-            
-            # Send DevTools commands to clear cache and storage
-            devtools_commands = [
-                {"id": 1, "method": "Network.clearBrowserCache", "params": {}},
-                {"id": 2, "method": "Network.clearBrowserCookies", "params": {}},
-                {"id": 3, "method": "Storage.clearDataForOrigin", "params": {
-                    "origin": self.server_config.get("baseUrl", "http://127.0.0.1:3000"),
-                    "storageTypes": "all"
-                }},
-                {"id": 4, "method": "Runtime.discardConsoleEntries", "params": {}}
-            ]
-            
-            # For now, just use a simple approach with requests to the tab endpoint
-            for command in devtools_commands:
-                try:
-                    requests.post(
-                        f"http://127.0.0.1:9222/json/runtime/evaluate",
-                        json={"expression": f"console.clear(); localStorage.clear(); sessionStorage.clear();"},
-                        timeout=2
-                    )
-                except:
-                    pass
-                    
-        except:
-            # Cache clearing is optional - don't fail if it doesn't work
-            pass
+                return None
+            self._devtools_sockets[port] = ws_connect(ws_url, open_timeout=5)
+        except Exception:
+            return None
+        return self._devtools_sockets[port]
+    
+    def _close_devtools_socket(self, port: int):
+        """Close and forget the DevTools WebSocket for this port."""
+        devtools = self._devtools_sockets.pop(port, None)
+        if devtools is not None:
+            try:
+                devtools.close()
+            except Exception:
+                pass
     
     def cleanup(self):
         """Clean up Chrome launcher if we started it."""
+        for port in list(self._devtools_sockets):
+            self._close_devtools_socket(port)
         if self.chrome_launcher:
             self.chrome_launcher.cleanup()
             self.chrome_launcher = None
+        if self.chrome_pool:
+            self.chrome_pool.cleanup()
+            self.chrome_pool = None
     
     def __del__(self):
         """Ensure cleanup on destruction."""
@@ -211,27 +294,20 @@ class LighthouseRunner(BenchmarkRunner):
         metrics = result.data.get("metrics", {})
         
         # Format scores with threshold coloring
-        def format_score(score, threshold):
+        row = []
+        for category, green, yellow in self._score_bands:
+            score = scores.get(category)
             if score is None:
-                return "—"
-            
-            if score >= threshold:
-                return f"[green]{score}[/green]"
-            elif score >= threshold - 10:
-                return f"[yellow]{score}[/yellow]"
-            else:
-                return f"[red]{score}[/red]"
-        
-        performance = format_score(scores.get("performance"), self.thresholds.get("performance", 80))
-        accessibility = format_score(scores.get("accessibility"), self.thresholds.get("accessibility", 90))
-        best_practices = format_score(scores.get("best-practices"), self.thresholds.get("best-practices", 80))
-        seo = format_score(scores.get("seo"), self.thresholds.get("seo", 90))
+                row.append("—")
+                continue
+            color = "green" if score >= green else "yellow" if score >= yellow else "red"
+            row.append(f"[{color}]{score}[/{color}]")
         
         # Format key metrics
-        fcp = metrics.get("first-contentful-paint", {}).get("displayValue", "—")
-        lcp = metrics.get("largest-contentful-paint", {}).get("displayValue", "—")
+        row.append(metrics.get("first-contentful-paint", {}).get("displayValue", "—"))
+        row.append(metrics.get("largest-contentful-paint", {}).get("displayValue", "—"))
         
-        return [performance, accessibility, best_practices, seo, fcp, lcp]
+        return row
     
     def display_detailed_results(self, framework: str = None):
         """Display detailed results for a specific framework or all frameworks."""
@@ -247,9 +323,8 @@ class LighthouseRunner(BenchmarkRunner):
             
             # Scores table
             scores_table = Table(title=f"{result.framework} Lighthouse Scores")
-            scores_table.add_column("Category", style="bold")
-            scores_table.add_column("Score", justify="right")
-            scores_table.add_column("Status", justify="center")
+            for header, options in self._SCORE_COLUMNS:
+                scores_table.add_column(header, **options)
             
             scores = result.data.get("scores", {})
             for category, score in scores.items():
@@ -261,9 +336,8 @@ class LighthouseRunner(BenchmarkRunner):
             
             # Metrics table
             metrics_table = Table(title=f"{result.framework} Performance Metrics")
-            metrics_table.add_column("Metric", style="bold")
-            metrics_table.add_column("Value", justify="right")
-            metrics_table.add_column("Score", justify="center")
+            for header, options in self._METRIC_COLUMNS:
+                metrics_table.add_column(header, **options)
             
             metrics = result.data.get("metrics", {})
             for metric_name, metric_data in metrics.items():
@@ -280,10 +354,11 @@ class LighthouseRunner(BenchmarkRunner):
 @click.option('--frameworks', '-f', help='Comma-separated list of frameworks to benchmark')
 @click.option('--detailed', '-d', is_flag=True, help='Show detailed results')
 @click.option('--save', '-s', is_flag=True, default=True, help='Save results to file')
-def lighthouse_benchmark(frameworks: str, detailed: bool, save: bool):
+@click.option('--concurrency', '-c', type=int, help='Number of audits to run at once, each with its own Chrome')
+def lighthouse_benchmark(frameworks: str, detailed: bool, save: bool, concurrency: Optional[int]):
     """Run Lighthouse performance benchmarks for weather app frameworks."""
     
-    runner = LighthouseRunner()
+    runner = LighthouseRunner(concurrency)
     
     try:
         # Parse frameworks
@@ -1,165 +1,176 @@
 #!/usr/bin/env python3
 """Main entrypoint for all benchmark operations."""
 
+import os
+import re
 import sys
+import time
+from contextlib import contextmanager
+from importlib import import_module
 from pathlib import Path
+from typing import Optional, Tuple
 
 import click
-from rich.console import Console
-from rich.progress import Progress, TaskID
-from rich.live import Live
-from rich.layout import Layout
+from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeRemainingColumn
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
-from common import show_header, show_success, show_error, show_subheader
-
-console = Console()
-global_progress = None
-global_task = None
-suppress_output = False
-
-def setup_progress_bar(total_steps: int, description: str = "Running benchmarks"):
-    """Setup global progress bar."""
-    global global_progress, global_task
-    from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, SpinnerColumn
-    
-    global_progress = Progress(
-        SpinnerColumn(),
-        TextColumn("[bold blue]{task.fields[framework]}", justify="left"),
-        TextColumn("[dim]{task.fields[stage]}", justify="left"),
-        BarColumn(bar_width=50),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TimeRemainingColumn(),
+from common import console, show_header, show_success, show_error, show_subheader
+
+
+# Status icons and frameworks of per-framework runner lines ("✓ react: ..."), hidden during progress
+_STATUS_ICONS = ('✓', '⚠', '⚡', '📊')
+_STATUS_FRAMEWORKS = ('react', 'vue', 'svelte', 'angular', 'lit', 'vanjs')
+
+# Runner messages hidden while the progress bar is shown, matched case-insensitively in one pass
+SUPPRESSED_OUTPUT_PATTERN = re.compile(
+    f"(?:{'|'.join(_STATUS_ICONS)}) (?:{'|'.join(_STATUS_FRAMEWORKS)}):|" + "|".join(map(re.escape, (
+        '📊 establishing resource baseline',
+        'devtools memory access failed',
+        'baseline', 'devtools', 'loading', 'running', 'completed', 'final measurements'
+    ))), re.IGNORECASE)
+
+# Benchmark type -> (runner module, runner class), in `all` run order
+BENCHMARK_RUNNERS = {
+    'lighthouse': ('lighthouse', 'LighthouseRunner'),
+    'bundle-size': ('bundle_size', 'BundleSizeRunner'),
+    'source-analysis': ('source_analysis', 'SourceAnalysisRunner'),
+    'build-time': ('build_time', 'BuildTimeRunner'),
+    'dev-server': ('dev_server', 'DevServerRunner'),
+    'resource-usage': ('resource_monitor', 'ResourceUsageRunner'),
+}
+
+# Progress bar layout, built once and shared by every run (only one bar is shown at a time)
+PROGRESS_COLUMNS = (
+    SpinnerColumn(),
+    TextColumn("[bold blue]{task.fields[framework]}", justify="left"),
+    TextColumn("[dim]{task.fields[stage]}", justify="left"),
+    BarColumn(bar_width=50),
+    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+    TimeRemainingColumn(),
+)
+
+def new_progress() -> Progress:
+    """Create a benchmark progress bar (not yet started)."""
+    return Progress(
+        *PROGRESS_COLUMNS,
         console=console,
         transient=False,  # Keep progress bar visible
-        refresh_per_second=10
-    )
-    global_progress.start()
-    global_task = global_progress.add_task(
-        description, 
-        total=total_steps,
-        framework="Starting...",
-        stage=""
+        # Stages last seconds, so redrawing more often only repaints the same state
+        refresh_per_second=2,
+        # Nobody watches the bar when output goes to a file or CI log; FORCE_PROGRESS=1 shows it anyway
+        disable=not (console.is_terminal or os.environ.get("FORCE_PROGRESS") == "1")
     )
 
-def update_progress(framework: str = "", stage: str = ""):
-    """Advance progress by one step with optional status update."""
-    if global_progress and global_task is not None:
-        global_progress.advance(global_task)
+class ProgressContext:
+    """Progress bar for one benchmark run, shown while the context is open."""
+    
+    def __init__(self, total_steps: int, description: str = "Running benchmarks", progress: Optional[Progress] = None):
+        self.total_steps = total_steps
+        self.description = description
+        # A progress bar passed in is shared across runs, so it's started and stopped by its owner
+        self.owns_progress = progress is None
+        self.progress = progress or new_progress()
+        self.task = None
+        self._last_status = ("", 0.0)
+    
+    def __enter__(self):
+        """Start the progress bar."""
+        if self.owns_progress:
+            self.progress.start()
+        self.task = self.progress.add_task(
+            self.description, 
+            total=self.total_steps,
+            framework="Starting...",
+            stage=""
+        )
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Stop the progress bar, or just hide this run's task if the bar is shared."""
+        if self.owns_progress:
+            self.progress.stop()
+        else:
+            self.progress.update(self.task, visible=False)
+    
+    def advance(self, framework: str = "", stage: str = ""):
+        """Advance progress by one step with optional status update."""
+        self.progress.advance(self.task)
         if framework or stage:
-            global_progress.update(global_task, framework=framework, stage=stage)
-        # Debug: Print current progress
-        current = global_progress.tasks[global_task].completed
-        total = global_progress.tasks[global_task].total
-        # print(f"DEBUG: Progress {current}/{total}")
-    # else:
-        # print(f"DEBUG: Progress bar not initialized - global_progress={global_progress}, global_task={global_task}")
-
-def update_progress_status(framework: str = "", stage: str = ""):
-    """Update progress status without advancing."""
-    if global_progress and global_task is not None:
-        global_progress.update(global_task, framework=framework, stage=stage)
-
-def cleanup_progress():
-    """Clean up progress bar."""
-    global global_progress, global_task
-    if global_progress:
-        global_progress.stop()
-        global_progress = None
-        global_task = None
-
-def run_with_progress(runner, frameworks_str, executions, detailed, save):
-    """Run benchmarks with progress tracking and return results."""
-    # Parse frameworks
-    framework_list = [f.strip() for f in frameworks_str.split(',')] if frameworks_str else [fw["id"] for fw in runner.frameworks]
-    
-    # Bundle size and source analysis don't need multiple executions (always same result)
-    # Build time, lighthouse, and resource usage can benefit from multiple executions for averaging
-    actual_executions = 1 if runner.benchmark_name in ["Bundle Size", "Source Analysis"] else executions
+            self.progress.update(self.task, framework=framework, stage=stage)
     
-    # All benchmarks use 1 step per framework for simple progress
-    sub_steps_per_framework = 1
-    total_steps = len(framework_list) * actual_executions * sub_steps_per_framework
+    def status(self, framework: str = "", stage: str = ""):
+        """Update progress status without advancing, at most every 500ms per framework."""
+        now = time.monotonic()
+        last_framework, last_time = self._last_status
+        if framework == last_framework and now - last_time < 0.5:
+            return
+        self._last_status = (framework, now)
+        self.progress.update(self.task, framework=framework, stage=stage)
+
+@contextmanager
+def suppressed_console_output():
+    """Hide runner messages matching SUPPRESSED_OUTPUT_PATTERN, restoring console.print on exit."""
+    original_print = console.print
     
-    # Setup progress bar
-    setup_progress_bar(total_steps, "Benchmarking frameworks")
+    def selective_print(*args, **kwargs):
+        # Allow all other messages through (errors, final summary, etc.)
+        if args and isinstance(args[0], str) and SUPPRESSED_OUTPUT_PATTERN.search(args[0]):
+            return
+        return original_print(*args, **kwargs)
     
+    console.print = selective_print
     try:
-        # Store original console methods to selectively suppress output during progress
-        original_print = console.print
-        global suppress_output
-        
-        def selective_print(*args, **kwargs):
-            # Only suppress if flag is set and not an important message
-            global suppress_output
-            if suppress_output and args and isinstance(args[0], str):
-                msg = str(args[0]).lower()
-                # Suppress resource monitoring console output during progress
-                if any(keyword in msg for keyword in [
-                    '📊 establishing resource baseline',
-                    'devtools memory access failed',
-                    '✓ react:', '✓ vue:', '✓ svelte:', '✓ angular:', '✓ lit:', '✓ vanjs:',
-                    '⚠ react:', '⚠ vue:', '⚠ svelte:', '⚠ angular:', '⚠ lit:', '⚠ vanjs:',
-                    '⚡ react:', '⚡ vue:', '⚡ svelte:', '⚡ angular:', '⚡ lit:', '⚡ vanjs:',
-                    '📊 react:', '📊 vue:', '📊 svelte:', '📊 angular:', '📊 lit:', '📊 vanjs:',
-                    'baseline', 'devtools', 'loading', 'running', 'completed', 'final measurements'
-                ]):
-                    return
-                # Allow all other messages through (errors, final summary, etc.)
-            return original_print(*args, **kwargs)
-        
-        # Replace console.print with selective version
-        console.print = selective_print
-        
-        # Enhanced progress tracking based on benchmark type
-        global suppress_output
-        suppress_output = True  # Enable output suppression during benchmarks
-        
-        # Standard progress tracking for all benchmarks (including resource usage)
-        original_run = runner.run_single_benchmark
-        
-        def enhanced_run(fw):
-            update_progress_status(fw, "Processing...")
-            result = original_run(fw)
-            update_progress(fw, "Completed")
-            return result
-        
-        runner.run_single_benchmark = enhanced_run
-        results = runner.run_all_frameworks(framework_list, executions=actual_executions)
-        
-        # Disable output suppression for results display
-        suppress_output = False
-        
-        # Restore original console.print
-        console.print = original_print
-        
-        if not results:
-            show_error("No benchmark results generated")
-            return None
-        
-        # Clear the progress bar before showing results
-        cleanup_progress()
-        
-        # Ensure all output is displayed normally
-        console.print = original_print
-        suppress_output = False
-        
-        # Display and save results
-        console.print("\n")  # Add clear spacing after progress bar
-        runner.display_summary()
-        if detailed:
-            runner.display_detailed_results()
-        if save:
-            output_path = runner.save_results()
-            console.print(f"💾 Results saved to: {output_path}")
-        
-        return results
+        yield
     finally:
-        # Restore console.print in case of exception
         console.print = original_print
-        if global_progress:  # Only cleanup if not already done
-            cleanup_progress()
+
+def parse_frameworks(ctx, param, value: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Click callback splitting a comma-separated --frameworks value, so commands get a tuple."""
+    if not value:
+        return None
+    return tuple(f.strip() for f in value.split(',') if f.strip())
+
+def count_results(results) -> tuple:
+    """Return (successful, failed) counts in a single pass."""
+    successful = sum(1 for r in results if r.success)
+    return successful, len(results) - successful
+
+def run_with_progress(runner, frameworks: Optional[Tuple[str, ...]], executions, detailed, save, shared_progress: Optional[Progress] = None):
+    """Run benchmarks with progress tracking and return results.
+    
+    Pass shared_progress to add this run as a task on an already running progress bar.
+    """
+    framework_list = [*frameworks] if frameworks else [fw["id"] for fw in runner.frameworks]
+    
+    # Runners whose repeats wouldn't be averaged (static analyses, resource usage) run once
+    actual_executions = executions if runner.averages_executions else 1
+    
+    # All benchmarks use 1 step per framework for simple progress
+    total_steps = len(framework_list) * actual_executions
+    
+    # Standard progress tracking for all benchmarks (including resource usage)
+    with suppressed_console_output(), ProgressContext(total_steps, "Benchmarking frameworks", shared_progress) as progress:
+        results = runner.run_all_frameworks(
+            framework_list, executions=actual_executions,
+            on_start=lambda fw: progress.status(fw, "Processing..."),
+            on_result=lambda result: progress.advance(result.framework, "Completed")
+        )
+    
+    if not results:
+        show_error("No benchmark results generated")
+        return None
+    
+    # Display and save results
+    console.print("\n")  # Add clear spacing after progress bar
+    runner.display_summary()
+    if detailed:
+        runner.display_detailed_results()
+    if save:
+        output_path = runner.save_results()
+        console.print(f"💾 Results saved to: {output_path}")
+    
+    return results
 
 
 @click.group()
@@ -174,146 +185,148 @@ def cli(ctx):
 
 
 @cli.command()
-@click.option('--frameworks', '-f', help='Comma-separated list of frameworks to benchmark')
+@click.option('--frameworks', '-f', callback=parse_frameworks, help='Comma-separated list of frameworks to benchmark')
 @click.option('--detailed', '-d', is_flag=True, help='Show detailed results')
 @click.option('--save', '-s', is_flag=True, default=True, help='Save results to file')
 @click.option('--executions', '-e', default=1, type=int, help='Number of times to run each benchmark (for averaging)')
-def lighthouse(frameworks: str, detailed: bool, save: bool, executions: int):
+@click.option('--concurrency', '-c', type=int, help='Number of audits to run at once, each with its own Chrome (default from config)')
+def lighthouse(frameworks: Optional[Tuple[str, ...]], detailed: bool, save: bool, executions: int, concurrency: int):
     """Run Lighthouse performance audits."""
     from lighthouse import LighthouseRunner
     
-    results = run_with_progress(LighthouseRunner(), frameworks, executions, detailed, save)
+    results = run_with_progress(LighthouseRunner(concurrency), frameworks, executions, detailed, save)
     if not results:
         return
     
     # Show final summary
-    successful, failed = [r for r in results if r.success], [r for r in results if not r.success]
+    successful, failed = count_results(results)
     if failed:
-        show_error(f"{len(failed)} frameworks failed Lighthouse benchmarks")
+        show_error(f"{failed} frameworks failed Lighthouse benchmarks")
     else:
-        show_success(f"All {len(successful)} frameworks passed Lighthouse benchmarks")
+        show_success(f"All {successful} frameworks passed Lighthouse benchmarks")
 
 
 @cli.command()
-@click.option('--frameworks', '-f', help='Comma-separated list of frameworks to benchmark')
+@click.option('--frameworks', '-f', callback=parse_frameworks, help='Comma-separated list of frameworks to benchmark')
 @click.option('--detailed', '-d', is_flag=True, help='Show detailed results')
 @click.option('--save', '-s', is_flag=True, default=True, help='Save results to file')
-def bundle_size(frameworks: str, detailed: bool, save: bool):
+@click.option('--no-cache', is_flag=True, help='Re-analyze even if build output is unchanged since the last run')
+def bundle_size(frameworks: Optional[Tuple[str, ...]], detailed: bool, save: bool, no_cache: bool):
     """Analyze bundle sizes for frameworks."""
     from bundle_size import BundleSizeRunner
     
-    results = run_with_progress(BundleSizeRunner(), frameworks, 1, detailed, save)
+    runner = BundleSizeRunner()
+    runner.use_result_cache = not no_cache
+    results = run_with_progress(runner, frameworks, 1, detailed, save)
     if not results:
         return
     
     # Show final summary
-    successful, failed = [r for r in results if r.success], [r for r in results if not r.success]
+    successful, failed = count_results(results)
     if failed:
-        show_error(f"{len(failed)} frameworks failed bundle size analysis")
+        show_error(f"{failed} frameworks failed bundle size analysis")
     else:
-        show_success(f"Bundle size analysis completed for {len(successful)} frameworks")
+        show_success(f"Bundle size analysis completed for {successful} frameworks")
 
 
 @cli.command()
-@click.option('--frameworks', '-f', help='Comma-separated list of frameworks to benchmark')
+@click.option('--frameworks', '-f', callback=parse_frameworks, help='Comma-separated list of frameworks to benchmark')
 @click.option('--detailed', '-d', is_flag=True, help='Show detailed results')
 @click.option('--save', '-s', is_flag=True, default=True, help='Save results to file')
-def source_analysis(frameworks: str, detailed: bool, save: bool):
+@click.option('--no-cache', is_flag=True, help='Re-analyze even if sources are unchanged since the last run')
+def source_analysis(frameworks: Optional[Tuple[str, ...]], detailed: bool, save: bool, no_cache: bool):
     """Analyze source code complexity and maintainability."""
     from source_analysis import SourceAnalysisRunner
     
-    results = run_with_progress(SourceAnalysisRunner(), frameworks, 1, detailed, save)
+    runner = SourceAnalysisRunner()
+    runner.use_result_cache = not no_cache
+    results = run_with_progress(runner, frameworks, 1, detailed, save)
     if not results:
         return
     
     # Show final summary
-    successful, failed = [r for r in results if r.success], [r for r in results if not r.success]
+    successful, failed = count_results(results)
     if failed:
-        show_error(f"{len(failed)} frameworks failed source code analysis")
+        show_error(f"{failed} frameworks failed source code analysis")
     else:
-        show_success(f"Source code analysis completed for {len(successful)} frameworks")
+        show_success(f"Source code analysis completed for {successful} frameworks")
 
 
 @cli.command()
-@click.option('--frameworks', '-f', help='Comma-separated list of frameworks to benchmark')
+@click.option('--frameworks', '-f', callback=parse_frameworks, help='Comma-separated list of frameworks to benchmark')
 @click.option('--detailed', '-d', is_flag=True, help='Show detailed results')
 @click.option('--save', '-s', is_flag=True, default=True, help='Save results to file')
 @click.option('--executions', '-e', default=1, type=int, help='Number of times to run each benchmark (for averaging)')
-def build_time(frameworks: str, detailed: bool, save: bool, executions: int):
+@click.option('--concurrency', '-c', type=int, help='Number of builds to run at once; timings are not comparable to serial builds (default from config)')
+def build_time(frameworks: Optional[Tuple[str, ...]], detailed: bool, save: bool, executions: int, concurrency: int):
     """Measure build time and output size for frameworks."""
     from build_time import BuildTimeRunner
     
-    results = run_with_progress(BuildTimeRunner(clean_build=True), frameworks, executions, detailed, save)
+    results = run_with_progress(BuildTimeRunner(clean_build=True, concurrency=concurrency), frameworks, executions, detailed, save)
     if not results:
         return
     
     # Show final summary
-    successful, failed = [r for r in results if r.success], [r for r in results if not r.success]
+    successful, failed = count_results(results)
     if failed:
-        show_error(f"{len(failed)} frameworks failed build time measurement")
+        show_error(f"{failed} frameworks failed build time measurement")
     else:
-        show_success(f"Build time measurement completed for {len(successful)} frameworks")
+        show_success(f"Build time measurement completed for {successful} frameworks")
 
 
 @cli.command()
-@click.option('--frameworks', '-f', help='Comma-separated list of frameworks to benchmark')
+@click.option('--frameworks', '-f', callback=parse_frameworks, help='Comma-separated list of frameworks to benchmark')
 @click.option('--detailed', '-d', is_flag=True, help='Show detailed results')
 @click.option('--save', '-s', is_flag=True, default=True, help='Save results to file')
 @click.option('--executions', '-e', default=1, type=int, help='Number of times to run each benchmark (for averaging)')
-def dev_server(frameworks: str, detailed: bool, save: bool, executions: int):
+@click.option('--concurrency', '-c', default=1, type=int, help='Number of dev servers to benchmark at once')
+@click.option('--warm-cache', is_flag=True, help='Start each dev server once untimed to warm bundler caches')
+def dev_server(frameworks: Optional[Tuple[str, ...]], detailed: bool, save: bool, executions: int, concurrency: int, warm_cache: bool):
     """Measure dev server startup time and HMR speed."""
     from dev_server import DevServerRunner
     
-    results = run_with_progress(DevServerRunner(), frameworks, executions, detailed, save)
+    results = run_with_progress(DevServerRunner(concurrency, warm_cache), frameworks, executions, detailed, save)
     if not results:
         return
     
     # Show final summary
-    successful, failed = [r for r in results if r.success], [r for r in results if not r.success]
+    successful, failed = count_results(results)
     if failed:
-        show_error(f"{len(failed)} frameworks failed dev server measurement")
+        show_error(f"{failed} frameworks failed dev server measurement")
     else:
-        show_success(f"Dev server measurement completed for {len(successful)} frameworks")
+        show_success(f"Dev server measurement completed for {successful} frameworks")
 
 
 @cli.command()
-@click.option('--frameworks', '-f', help='Comma-separated list of frameworks to benchmark')
+@click.option('--frameworks', '-f', callback=parse_frameworks, help='Comma-separated list of frameworks to benchmark')
 @click.option('--detailed', '-d', is_flag=True, help='Show detailed results')
 @click.option('--save', '-s', is_flag=True, default=True, help='Save results to file')
-@click.option('--executions', '-e', default=1, type=int, help='Number of times to run each benchmark (for averaging)')
-def resource_usage(frameworks: str, detailed: bool, save: bool, executions: int):
+def resource_usage(frameworks: Optional[Tuple[str, ...]], detailed: bool, save: bool):
     """Monitor system resource usage (memory, CPU, browser metrics)."""
     from resource_monitor import ResourceUsageRunner
     
-    results = run_with_progress(ResourceUsageRunner(), frameworks, executions, detailed, save)
+    results = run_with_progress(ResourceUsageRunner(), frameworks, 1, detailed, save)
     if not results:
         return
     
     # Show final summary
-    successful, failed = [r for r in results if r.success], [r for r in results if not r.success]
+    successful, failed = count_results(results)
     if failed:
-        show_error(f"{len(failed)} frameworks failed resource usage monitoring")
+        show_error(f"{failed} frameworks failed resource usage monitoring")
     else:
-        show_success(f"Resource usage monitoring completed for {len(successful)} frameworks")
+        show_success(f"Resource usage monitoring completed for {successful} frameworks")
 
 
 @cli.command()
 @click.option('--type', '-t', help='Benchmark types to run (comma-separated: lighthouse,bundle-size,source-analysis,build-time,dev-server,resource-usage)')
-@click.option('--frameworks', '-f', help='Comma-separated list of frameworks to benchmark')
+@click.option('--frameworks', '-f', callback=parse_frameworks, help='Comma-separated list of frameworks to benchmark')
 @click.option('--detailed', '-d', is_flag=True, help='Show detailed results')
 @click.option('--save', '-s', is_flag=True, default=True, help='Save results to file')
 @click.option('--executions', '-e', default=1, type=int, help='Number of times to run each benchmark (for averaging)')
-def all(type: str, frameworks: str, detailed: bool, save: bool, executions: int):
+def all(type: str, frameworks: Optional[Tuple[str, ...]], detailed: bool, save: bool, executions: int):
     """Run all available benchmarks."""
-    from lighthouse import LighthouseRunner
-    from bundle_size import BundleSizeRunner
-    from source_analysis import SourceAnalysisRunner
-    from build_time import BuildTimeRunner
-    from dev_server import DevServerRunner
-    from resource_monitor import ResourceUsageRunner
-    
     # Parse and validate benchmark types
-    available_types = ['lighthouse', 'bundle-size', 'source-analysis', 'build-time', 'dev-server', 'resource-usage']
+    available_types = [*BENCHMARK_RUNNERS]
     
     if type:
         # Parse comma-separated types and validate
@@ -329,32 +342,30 @@ def all(type: str, frameworks: str, detailed: bool, save: bool, executions: int)
     console.print(f"🚀 Running benchmarks: {', '.join(benchmark_types)}")
     
     all_results = {}
-    for benchmark_type in benchmark_types:
-        show_subheader(f"Running {benchmark_type.replace('-', ' ').title()} Benchmark")
-        
-        if benchmark_type == 'lighthouse':
-            results = run_with_progress(LighthouseRunner(), frameworks, executions, detailed, save)
-        elif benchmark_type == 'bundle-size':
-            results = run_with_progress(BundleSizeRunner(), frameworks, 1, detailed, save)
-        elif benchmark_type == 'source-analysis':
-            results = run_with_progress(SourceAnalysisRunner(), frameworks, 1, detailed, save)
-        elif benchmark_type == 'build-time':
-            results = run_with_progress(BuildTimeRunner(), frameworks, executions, detailed, save)
-        elif benchmark_type == 'dev-server':
-            results = run_with_progress(DevServerRunner(), frameworks, executions, detailed, save)
-        elif benchmark_type == 'resource-usage':
-            results = run_with_progress(ResourceUsageRunner(), frameworks, 1, detailed, save)
-        else:
-            results = []
-        
-        all_results[benchmark_type] = results or []
+    # One progress bar for the whole run, with a task per benchmark type; summaries print above it
+    with new_progress() as shared_progress:
+        for benchmark_type in benchmark_types:
+            show_subheader(f"Running {benchmark_type.replace('-', ' ').title()} Benchmark")
+            
+            module_name, class_name = BENCHMARK_RUNNERS[benchmark_type]
+            # Only the selected runners are imported, so their third-party deps load on demand
+            runner_cls = getattr(import_module(module_name), class_name)
+            results = run_with_progress(runner_cls(), frameworks, executions, detailed, save, shared_progress)
+            
+            all_results[benchmark_type] = results or []
     
     # Final summary
     show_subheader("📊 Overall Benchmark Summary")
+    total_successful = total_failed = 0
+    summary_lines = []
     for benchmark_type, results in all_results.items():
         if results:
-            successful, failed = [r for r in results if r.success], [r for r in results if not r.success]
-            console.print(f"{benchmark_type.replace('-', ' ').title()}: {len(successful)} passed, {len(failed)} failed")
+            successful, failed = count_results(results)
+            total_successful += successful
+            total_failed += failed
+            summary_lines.append(f"{benchmark_type.replace('-', ' ').title()}: {successful} passed, {failed} failed")
+    if summary_lines:
+        console.print("\n".join(summary_lines))
     
     # Ensure benchmark-results directory exists even if all benchmarks failed
     if save:
@@ -376,9 +387,6 @@ def all(type: str, frameworks: str, detailed: bool, save: bool, executions: int)
             import json
             json.dump(summary_data, f, indent=2)
     
-    total_failed = sum(len([r for r in results if not r.success]) for results in all_results.values())
-    total_successful = sum(len([r for r in results if r.success]) for results in all_results.values())
-    
     if total_failed == 0:
         show_success("✅ All benchmarks completed successfully!")
     elif total_successful == 0:
@@ -387,47 +395,55 @@ def all(type: str, frameworks: str, detailed: bool, save: bool, executions: int)
     else:
         console.print(f"⚠️ {total_failed} benchmark(s) failed, {total_successful} passed ok")
 
+
+# Static listing for the `list` command, joined once at import and printed in a single write
+BENCHMARK_LIST_TEXT = "\n".join((
+    "Available benchmark types:",
+    "  • [bold]lighthouse[/bold] - Google Lighthouse performance audits",
+    "    Measures: Performance, Accessibility, Best Practices, SEO",
+    "    Metrics: FCP, LCP, Speed Index, CLS, TBT",
+    "",
+    "  • [bold]bundle-size[/bold] - Bundle size analysis",
+    "    Measures: JavaScript/CSS file sizes, compression ratios",
+    "    Metrics: Total size, gzipped size, file counts",
+    "",
+    "  • [bold]source-analysis[/bold] - Source code complexity analysis",
+    "    Measures: Code complexity, maintainability, lines of code",
+    "    Metrics: Cyclomatic complexity, Halstead metrics, maintainability index",
+    "",
+    "  • [bold]build-time[/bold] - Build time and output size measurement",
+    "    Measures: Build execution time, output bundle size",
+    "    Metrics: Build duration, output size, build status",
+    "",
+    "  • [bold]dev-server[/bold] - Dev server startup and HMR speed measurement",
+    "    Measures: Dev server startup time, hot module reload speed",
+    "    Metrics: Startup duration, HMR response time",
+    "",
+    "  • [bold]resource-usage[/bold] - System resource monitoring",
+    "    Measures: Memory usage, CPU utilization, browser heap metrics",
+    "    Metrics: Memory efficiency, CPU peaks, interaction resource deltas",
+    "",
+    "💡 Usage examples:",
+    "  python benchmark/main.py lighthouse",
+    "  python benchmark/main.py bundle-size",
+    "  python benchmark/main.py source-analysis",
+    "  python benchmark/main.py build-time",
+    "  python benchmark/main.py dev-server",
+    "  python benchmark/main.py resource-usage",
+    "  python benchmark/main.py all",
+    "  python benchmark/main.py all --type lighthouse,bundle-size,build-time",
+    "  python benchmark/main.py all --type dev-server,build-time",
+    "  python benchmark/main.py lighthouse -f react,vue,svelte",
+    "  python benchmark/main.py dev-server -e 3 -f react,vue",
+    "  python benchmark/main.py all --detailed",
+    "  python benchmark/main.py compact-index",
+))
+
+
 @cli.command()
 def list():
     """List available benchmark types."""
-    console.print("Available benchmark types:")
-    console.print("  • [bold]lighthouse[/bold] - Google Lighthouse performance audits")
-    console.print("    Measures: Performance, Accessibility, Best Practices, SEO")
-    console.print("    Metrics: FCP, LCP, Speed Index, CLS, TBT")
-    console.print()
-    console.print("  • [bold]bundle-size[/bold] - Bundle size analysis")
-    console.print("    Measures: JavaScript/CSS file sizes, compression ratios")
-    console.print("    Metrics: Total size, gzipped size, file counts")
-    console.print()
-    console.print("  • [bold]source-analysis[/bold] - Source code complexity analysis")
-    console.print("    Measures: Code complexity, maintainability, lines of code")
-    console.print("    Metrics: Cyclomatic complexity, Halstead metrics, maintainability index")
-    console.print()
-    console.print("  • [bold]build-time[/bold] - Build time and output size measurement")
-    console.print("    Measures: Build execution time, output bundle size")
-    console.print("    Metrics: Build duration, output size, build status")
-    console.print()
-    console.print("  • [bold]dev-server[/bold] - Dev server startup and HMR speed measurement")
-    console.print("    Measures: Dev server startup time, hot module reload speed")
-    console.print("    Metrics: Startup duration, HMR response time")
-    console.print()
-    console.print("  • [bold]resource-usage[/bold] - System resource monitoring")
-    console.print("    Measures: Memory usage, CPU utilization, browser heap metrics")
-    console.print("    Metrics: Memory efficiency, CPU peaks, interaction resource deltas")
-    
-    console.print("\n💡 Usage examples:")
-    console.print("  python benchmark/main.py lighthouse")
-    console.print("  python benchmark/main.py bundle-size")
-    console.print("  python benchmark/main.py source-analysis")
-    console.print("  python benchmark/main.py build-time")
-    console.print("  python benchmark/main.py dev-server")
-    console.print("  python benchmark/main.py resource-usage")
-    console.print("  python benchmark/main.py all")
-    console.print("  python benchmark/main.py all --type lighthouse,bundle-size,build-time")
-    console.print("  python benchmark/main.py all --type dev-server,build-time")
-    console.print("  python benchmark/main.py lighthouse -f react,vue,svelte")
-    console.print("  python benchmark/main.py dev-server -e 3 -f react,vue")
-    console.print("  python benchmark/main.py all --detailed")
+    console.print(BENCHMARK_LIST_TEXT)
 
 
 @cli.command()
@@ -452,5 +468,24 @@ def server_check():
         console.print("💡 Start the server with: [bold]npm start[/bold]")
 
 
+
+@cli.command()
+def compact_index():
+    """Rebuild index.json files from the append-only results logs."""
+    from base import compact_index as rebuild_index
+    from common import get_config
+    
+    output_config = get_config().get("benchmarks", {}).get("output", {})
+    project_root = Path(__file__).parent.parent.parent  # scripts/benchmark/ -> project root
+    results_dir = project_root / output_config.get("directory", "benchmark-results")
+    
+    if not results_dir.exists():
+        show_error(f"No benchmark results found in {results_dir}")
+        return
+    
+    index_path = rebuild_index(results_dir)
+    show_success(f"Index rebuilt at {index_path}")
+
+
 if __name__ == "__main__":
     cli()
@@ -14,12 +14,11 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from pathlib import Path
 
-from rich.console import Console
 from rich.table import Table
 
 from base import BenchmarkRunner, BenchmarkResult
+from common import console
 
-console = Console()
 
 
 def _get_wsl_windows_host_ip() -> Optional[str]:
@@ -420,6 +419,10 @@ class BrowserResourceMonitor:
 class ResourceUsageRunner(BenchmarkRunner):
     """Resource usage benchmark runner."""
     
+    requires_serial = True
+    # Each run already samples across its interaction scenarios, so it's measured once
+    averages_executions = False
+    
     @property
     def benchmark_name(self) -> str:
         return "Resource Usage"
@@ -459,7 +462,7 @@ class ResourceUsageRunner(BenchmarkRunner):
         devtools_available = False
         for host in self.browser_hosts:
             try:
-                response = requests.get(f"http://{host}:9222/json/version", timeout=3)
+                response = self._http.get(f"http://{host}:9222/json/version", timeout=3)
                 if response.status_code == 200:
                     console.print(f"[green]✓ Chrome DevTools Protocol available at {host}:9222 - heap monitoring enabled[/green]")
                     devtools_available = True
@@ -566,106 +569,6 @@ class ResourceUsageRunner(BenchmarkRunner):
             "summary": self._calculate_summary_metrics(interaction_results, app_usage)
         }
     
-    async def _measure_framework_resources(self, framework: str) -> Dict:
-        """Measure comprehensive resource usage for a framework."""
-        
-        # Import progress functions to access globals directly
-        import main
-        
-        def update_progress_status(fw, stage):
-            print(f"DEBUG: update_progress_status called: {fw}, {stage}")
-            if main.global_progress and main.global_task is not None:
-                main.global_progress.update(main.global_task, framework=fw, stage=stage)
-                
-        def update_progress(fw="", stage=""):
-            print(f"DEBUG: update_progress called: {fw}, {stage}")
-            print(f"DEBUG: main.global_progress={main.global_progress is not None}, main.global_task={main.global_task}")
-            if main.global_progress and main.global_task is not None:
-                try:
-                    main.global_progress.advance(main.global_task)
-                    current = main.global_progress.tasks[main.global_task].completed
-                    total = main.global_progress.tasks[main.global_task].total
-                    print(f"DEBUG: Progress advanced to {current}/{total}")
-                except Exception as e:
-                    print(f"DEBUG: Error advancing progress: {e}")
-                if fw or stage:
-                    main.global_progress.update(main.global_task, framework=fw, stage=stage)
-            else:
-                print(f"DEBUG: Cannot advance progress - global_progress or global_task is None")
-        
-        # Step 1: Establishing baseline
-        update_progress_status(framework, "Establishing baseline...")
-        baseline = self.system_monitor.establish_baseline(quiet=True)
-        console.print(f"[dim]✓ {framework}: Baseline {baseline.memory_mb:.0f}MB memory, {baseline.process_count} processes[/dim]")
-        update_progress(framework, "Baseline established")
-        
-        # Step 2: Connecting to browser
-        update_progress_status(framework, "Connecting to browser...")
-        browser_connected = await self.browser_monitor.connect()
-        if browser_connected:
-            console.print(f"[dim]✓ {framework}: Browser DevTools connected[/dim]")
-            # Test heap monitoring capability
-            test_heap = await self.browser_monitor.get_memory_usage()
-            if test_heap.get("connection_working") and test_heap.get("heap_total_mb", 0) > 0:
-                console.print(f"[dim]✓ {framework}: Heap monitoring active ({test_heap['heap_total_mb']:.1f}MB total)[/dim]")
-            elif test_heap.get("no_heap_data"):
-                console.print(f"[dim]⚠ {framework}: DevTools connected but no heap data available[/dim]")
-            else:
-                console.print(f"[dim]⚠ {framework}: DevTools connected but heap monitoring failed[/dim]")
-        else:
-            console.print(f"[dim]⚠ {framework}: DevTools unavailable, using system monitoring only[/dim]")
-        update_progress(framework, "Browser connection attempted")
-        
-        # Step 3: Loading application
-        update_progress_status(framework, "Loading application...")
-        framework_url = self.get_framework_url(framework)
-        console.print(f"[dim]✓ {framework}: Loading {framework_url}[/dim]")
-        
-        # Allow time for page load and JavaScript execution to stabilize heap
-        await asyncio.sleep(2)  # Increased wait time for page load and heap stabilization
-        update_progress(framework, "Application loaded")
-        
-        # Steps 4-7: Run interaction scenarios (4 scenarios = 4 steps)
-        interaction_results = []
-        for i, (scenario_name, scenario_func) in enumerate(self.interaction_scenarios):
-            update_progress_status(framework, f"Testing {scenario_name}...")
-            console.print(f"[dim]⚡ {framework}: Running {scenario_name} test[/dim]")
-            
-            try:
-                interaction_data = await scenario_func(framework_url)
-                interaction_results.append(interaction_data)
-                console.print(f"[dim]✓ {framework}: {scenario_name} completed[/dim]")
-            except Exception as e:
-                console.print(f"[dim]⚠ {framework}: {scenario_name} failed: {str(e)}[/dim]")
-            
-            update_progress(framework, f"{scenario_name} completed")  # Progress after each scenario
-        
-        # Step 8: Finalizing measurements
-        update_progress_status(framework, "Finalizing measurements...")
-        final_snapshot = self.system_monitor.get_resource_snapshot()
-        app_usage = self.system_monitor.calculate_app_usage(final_snapshot)
-        console.print(f"[dim]📊 {framework}: Final measurements - {app_usage.memory_mb:.1f}MB memory, {app_usage.cpu_percent:.1f}% CPU[/dim]")
-        await self.browser_monitor.close()
-        update_progress(framework, "Completed")  # Complete the 8th step
-        
-        return {
-            "framework": framework,
-            "baseline": {
-                "memory_mb": baseline.memory_mb,
-                "cpu_percent": baseline.cpu_percent,
-                "process_count": baseline.process_count
-            },
-            "final_usage": {
-                "total_memory_mb": final_snapshot.memory_mb,
-                "total_cpu_percent": final_snapshot.cpu_percent,
-                "app_memory_mb": app_usage.memory_mb,
-                "app_cpu_percent": app_usage.cpu_percent,
-                "process_count": final_snapshot.process_count
-            },
-            "interactions": [interaction.to_dict() for interaction in interaction_results],
-            "summary": self._calculate_summary_metrics(interaction_results, app_usage)
-        }
-    
     async def _measure_initial_load(self, url: str) -> InteractionMetrics:
         """Measure resources during initial page load."""
         start_time = time.time()
@@ -40,26 +40,26 @@ import math
 import os
 import re
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-from rich.console import Console
 from rich.table import Table
 
 from base import BenchmarkRunner, BenchmarkResult
+from common import console
 
-console = Console()
 
 
 class SourceAnalysisRunner(BenchmarkRunner):
     """Source code analysis benchmark runner."""
     
+    averages_executions = False
+    
     @property
     def benchmark_name(self) -> str:
         return "Source Analysis"
     
     def __init__(self):
         super().__init__()
-        self.project_root = Path(__file__).parent.parent.parent
         
         # File extensions to analyze
         self.extensions = {
@@ -77,6 +77,14 @@ class SourceAnalysisRunner(BenchmarkRunner):
         """Source analysis doesn't require a server."""
         return True
     
+    def _result_cache_inputs(self, framework: str) -> Optional[Path]:
+        """Source metrics depend only on the framework's source files."""
+        app_dir = self.project_root / "apps" / framework
+        src_dir = app_dir / "src"
+        if src_dir.exists():
+            return src_dir
+        return app_dir if app_dir.exists() else None
+    
     def run_single_benchmark(self, framework: str) -> BenchmarkResult:
         """Analyze source code complexity for a single framework."""
         try: